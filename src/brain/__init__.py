@@ -13,78 +13,58 @@ __version__ = "2.0.0"
 # =============================================================================
 # Backward compatibility re-exports for existing tests
 # =============================================================================
+# Resolved lazily (PEP 562) so importing one submodule, e.g. brain.cli for a
+# single command, does not load every other submodule through this package.
 
-# Core paths and utilities
-from brain.core import (
-    BRAIN_DIR,
-    SELF_FILE,
-    MESSAGES_DIR,
-    RECEIPTS_DIR,
-    CLAIMS_DIR,
-    EVENTS_FILE,
-    KEYS_DIR,
-    PRIVATE_KEYS_DIR,
-    PUBLIC_KEYS_DIR,
-    MISSIONS_DIR,
-    ACTIVE_MISSIONS_DIR,
-    COMPLETED_MISSIONS_DIR,
-    ABANDONED_MISSIONS_DIR,
-    DEV_BRANCH_PREFIX,
-    EVENTS_BRANCH,
-    COLORS,
-    EMOTIONS,
-    AGENT_EMOJI,
-    now_iso,
-    timestamp_filename,
-    ensure_brain_dirs,
-    ensure_mission_dirs,
-    ensure_key_dirs,
-    load_identity,
-    require_identity,
-    save_identity,
-    save_message,
-    append_event,
-    read_events,
-    safe_commit,
-    safe_push,
-    get_current_branch,
-    get_head_commit,
-    get_short_commit,
-    get_remote_head,
-    run_git,
-    git_output,
-    save_json,
-    load_json,
-)
+import importlib
 
-# Messaging commands
-from brain.messaging import (
-    cmd_send,
-    cmd_announce,
-    cmd_listen,
-    cmd_log,
-)
+_LAZY_EXPORTS = {
+    # Core paths and utilities
+    "brain.core": (
+        "BRAIN_DIR", "SELF_FILE", "MESSAGES_DIR", "RECEIPTS_DIR", "CLAIMS_DIR",
+        "EVENTS_FILE", "KEYS_DIR", "PRIVATE_KEYS_DIR", "PUBLIC_KEYS_DIR",
+        "MISSIONS_DIR", "ACTIVE_MISSIONS_DIR", "COMPLETED_MISSIONS_DIR",
+        "ABANDONED_MISSIONS_DIR", "DEV_BRANCH_PREFIX", "EVENTS_BRANCH",
+        "COLORS", "EMOTIONS", "AGENT_EMOJI", "now_iso", "timestamp_filename",
+        "ensure_brain_dirs", "ensure_mission_dirs", "ensure_key_dirs",
+        "load_identity", "require_identity", "save_identity", "save_message",
+        "save_messages_bulk", "append_event", "event_line", "read_events",
+        "safe_commit", "safe_push", "get_current_branch", "get_head_commit",
+        "get_short_commit", "get_remote_head", "run_git", "git_output",
+        "GitCatFile", "iter_blob_lines", "save_json", "load_json",
+    ),
+    # Messaging commands
+    "brain.messaging": ("cmd_send", "cmd_announce", "cmd_listen", "cmd_log"),
+    # Identity commands
+    "brain.identity": (
+        "generate_key_pair", "generate_key_pairs", "save_key_pair",
+        "load_private_key", "load_public_key", "cmd_init", "cmd_status",
+        "cmd_keys",
+    ),
+    # Phase commands
+    "brain.phases": (
+        "cmd_claim", "cmd_release", "cmd_complete", "cmd_phases", "cmd_sync",
+        "cmd_receipt",
+    ),
+    # CLI entry point
+    "brain.cli": ("main",),
+}
 
-# Identity commands
-from brain.identity import (
-    generate_key_pair,
-    save_key_pair,
-    load_private_key,
-    load_public_key,
-    cmd_init,
-    cmd_status,
-    cmd_keys,
-)
+_EXPORT_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
 
-# Phase commands
-from brain.phases import (
-    cmd_claim,
-    cmd_release,
-    cmd_complete,
-    cmd_phases,
-    cmd_sync,
-    cmd_receipt,
-)
+__all__ = list(_EXPORT_MODULES)
 
-# CLI entry point
-from brain.cli import main
+
+def __getattr__(name):
+    """Import the submodule that defines `name` on first access."""
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazy re-exports in dir(brain)."""
+    return sorted(set(globals()) | set(_EXPORT_MODULES))
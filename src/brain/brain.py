@@ -327,13 +327,11 @@ def verify_signature(message: str, signature_b64: str, public_pem: str) -> bool:
 
 
 def get_public_key_fingerprint(public_pem: str) -> str:
-    """Get a short fingerprint of a public key."""
+    """Get a short fingerprint of a public key (16 hex chars of its SHA-256)."""
     import hashlib
-    import base64
     
-    # Hash the public key and take first 16 chars
-    hash_bytes = hashlib.sha256(public_pem.encode('utf-8')).digest()
-    return base64.b64encode(hash_bytes).decode('utf-8')[:16]
+    # Same format as brain.identity.get_public_key_fingerprint
+    return hashlib.sha256(public_pem.encode('utf-8')).digest()[:8].hex()
 
 
 def ensure_key_dirs():
@@ -737,7 +735,7 @@ def cmd_sync(args):
         try:
             result = run_git(
                 "log", branch, "--oneline", "-5",
-                "--grep=msg(", "--grep=claim:", "--grep=complete:",
+                "-E", "--grep=msg\\(|claim:|complete:",
                 check=False
             )
             if result.stdout.strip():
@@ -774,8 +772,11 @@ def cmd_announce(args):
     # Stash all changes (including untracked) with timestamp
     stash_ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%f")
     stash_name = f"brain-announce-{stash_ts}"
-    stash_result = run_git("stash", "push", "-u", "-m", stash_name, check=False)
-    has_stash = "No local changes" not in stash_result.stdout
+    # Skip the stash round-trip entirely on a clean tree (the common case)
+    has_stash = bool(run_git("status", "--porcelain=v1", "-z", check=False).stdout)
+    if has_stash:
+        stash_result = run_git("stash", "push", "-u", "-m", stash_name, check=False)
+        has_stash = "No local changes" not in stash_result.stdout
     
     # Fetch latest events branch
     run_git("fetch", "origin", EVENTS_BRANCH, check=False)
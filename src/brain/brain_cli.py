@@ -11,13 +11,15 @@ Usage:
     brain <command> [args]
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add src/ to path so 'brain' package is importable when run directly
-src_dir = Path(__file__).parent.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+# (skipped when the package is already loaded, e.g. imported in-process)
+if "brain" not in sys.modules:
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
 
 from brain.cli import main
 
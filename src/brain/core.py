@@ -5,11 +5,15 @@ This module contains common functionality used across all brain domains.
 Following DRY principle: single source of truth for git ops, identity, and I/O.
 """
 
+import atexit
 import json
 import os
+import random
+import stat
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import uuid
@@ -30,6 +34,10 @@ COMPLETED_MISSIONS_DIR = MISSIONS_DIR / "completed"
 ABANDONED_MISSIONS_DIR = MISSIONS_DIR / "abandoned"
 MISSION_EVENTS_DIR = MISSIONS_DIR / "events"
 
+# Local-only derived state (never committed)
+CACHE_DIR = BRAIN_DIR / "cache"
+MISSION_SNAPSHOTS_DIR = CACHE_DIR / "mission-snapshots"
+
 # Key directories
 KEYS_DIR = BRAIN_DIR / "keys"
 PRIVATE_KEYS_DIR = KEYS_DIR / "private"
@@ -44,17 +52,17 @@ EVENTS_BRANCH = "brain/events"
 # Agent Identity - Colors & Emotions
 # =============================================================================
 
-COLORS = [
+COLORS: tuple[str, ...] = (
     "red", "blue", "green", "gold", "purple", "orange", "cyan", "magenta",
     "coral", "teal", "indigo", "amber", "lime", "rose", "violet", "silver",
     "crimson", "azure", "emerald", "ruby", "sapphire", "jade", "onyx", "pearl"
-]
+)
 
-EMOTIONS = [
+EMOTIONS: tuple[str, ...] = (
     "joy", "calm", "wonder", "spark", "glow", "peace", "bliss", "hope",
     "brave", "swift", "keen", "wise", "bold", "zen", "flow", "dream",
     "shine", "grace", "charm", "pride", "trust", "zeal", "muse", "awe"
-]
+)
 
 AGENT_EMOJI = {
     "claude": "\U0001F7E0",    # Orange
@@ -67,6 +75,11 @@ AGENT_EMOJI = {
     "default": "\U0001F916",   # Robot
 }
 
+# Precomputed (key, emoji) pairs: longest-first for prefix matching,
+# dict order for the substring fallback on novel names
+_AGENT_EMOJI_PREFIXES = tuple(sorted(AGENT_EMOJI.items(), key=lambda kv: -len(kv[0])))
+_AGENT_EMOJI_ITEMS = tuple(AGENT_EMOJI.items())
+
 
 # =============================================================================
 # Time Utilities
@@ -93,7 +106,6 @@ def generate_id(prefix: str = "id") -> str:
 
 def generate_color_emotion_id() -> tuple[str, str, str]:
     """Generate a random color-emotion pair for identity."""
-    import random
     color = random.choice(COLORS)
     emotion = random.choice(EMOTIONS)
     return color, emotion, f"{color}-{emotion}"
@@ -101,8 +113,19 @@ def generate_color_emotion_id() -> tuple[str, str, str]:
 
 def get_agent_emoji(name: str) -> str:
     """Get emoji for an agent type."""
-    name_lower = name.lower()
-    for key, emoji in AGENT_EMOJI.items():
+    return _agent_emoji_for(name.lower())
+
+
+@lru_cache(maxsize=256)
+def _agent_emoji_for(name_lower: str) -> str:
+    """Resolve emoji for a lowercased name (exact, then prefix, then substring)."""
+    emoji = AGENT_EMOJI.get(name_lower)
+    if emoji is not None:
+        return emoji
+    for prefix, emoji in _AGENT_EMOJI_PREFIXES:
+        if name_lower.startswith(prefix):
+            return emoji
+    for key, emoji in _AGENT_EMOJI_ITEMS:
         if key in name_lower:
             return emoji
     return AGENT_EMOJI["default"]
@@ -112,28 +135,45 @@ def get_agent_emoji(name: str) -> str:
 # Directory Management
 # =============================================================================
 
+_BRAIN_DIRS = (BRAIN_DIR, MESSAGES_DIR, RECEIPTS_DIR, CLAIMS_DIR)
+_MISSION_DIRS = (MISSIONS_DIR, ACTIVE_MISSIONS_DIR, COMPLETED_MISSIONS_DIR, ABANDONED_MISSIONS_DIR, MISSION_EVENTS_DIR)
+_KEY_DIRS = (PRIVATE_KEYS_DIR, PUBLIC_KEYS_DIR)
+
+
+def _ensure_dirs(dirs: tuple):
+    """
+    Create missing directories.
+
+    Checks with one stat per directory first; mkdir(exist_ok=True) would
+    otherwise cost a failed mkdir plus a stat on the steady-state path.
+    """
+    for d in dirs:
+        if not os.path.isdir(d):
+            d.mkdir(parents=True, exist_ok=True)
+
+
 def ensure_brain_dirs():
     """Create .brain directories if they don't exist."""
-    for d in [BRAIN_DIR, MESSAGES_DIR, RECEIPTS_DIR, CLAIMS_DIR]:
-        d.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs(_BRAIN_DIRS)
 
 
 def ensure_mission_dirs():
     """Create mission directories if they don't exist."""
-    for d in [MISSIONS_DIR, ACTIVE_MISSIONS_DIR, COMPLETED_MISSIONS_DIR, ABANDONED_MISSIONS_DIR, MISSION_EVENTS_DIR]:
-        d.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs(_MISSION_DIRS)
 
 
 def ensure_key_dirs():
     """Create key directories if they don't exist."""
-    PRIVATE_KEYS_DIR.mkdir(parents=True, exist_ok=True)
-    PUBLIC_KEYS_DIR.mkdir(parents=True, exist_ok=True)
-    os.chmod(PRIVATE_KEYS_DIR, 0o700)
+    _ensure_dirs(_KEY_DIRS)
+    if stat.S_IMODE(os.stat(PRIVATE_KEYS_DIR).st_mode) != 0o700:
+        os.chmod(PRIVATE_KEYS_DIR, 0o700)
 
 
 def require_project_root():
     """Ensure we're in project root or exit."""
-    if not Path("package.json").exists():
+    try:
+        os.stat("package.json")
+    except OSError:
         print("\u274C Must run from project root", file=sys.stderr)
         sys.exit(1)
 
@@ -142,10 +182,11 @@ def require_project_root():
 # Git Operations - Single implementation (DRY)
 # =============================================================================
 
-def run_git(*args, capture=True, check=True) -> subprocess.CompletedProcess:
-    """Run a git command."""
+def run_git(*args, capture=True, check=True, env_extra: Optional[dict] = None) -> subprocess.CompletedProcess:
+    """Run a git command; `env_extra` is layered over os.environ when given."""
     cmd = ["git"] + list(args)
-    return subprocess.run(cmd, capture_output=capture, text=True, check=check)
+    env = {**os.environ, **env_extra} if env_extra else None
+    return subprocess.run(cmd, capture_output=capture, text=True, check=check, env=env)
 
 
 def git_output(*args) -> str:
@@ -154,6 +195,73 @@ def git_output(*args) -> str:
     return result.stdout.strip()
 
 
+class GitCatFile:
+    """
+    Long-running `git cat-file --batch` process for reading blobs.
+
+    One process serves any number of reads, avoiding a `git show` fork per
+    object. Use as a context manager so the process is always reaped:
+
+        with GitCatFile() as cat_file:
+            data = cat_file.read("origin/main:path/to/file.json")
+    """
+
+    def __init__(self):
+        self._proc = None
+
+    def __enter__(self) -> "GitCatFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def read(self, obj: str) -> Optional[bytes]:
+        """Return the object's contents, or None if it doesn't exist."""
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        self._proc.stdin.write(obj.encode() + b"\n")
+        self._proc.stdin.flush()
+
+        # Header: "<sha> <type> <size>" or "<obj> missing" / "<obj> ambiguous"
+        header = self._proc.stdout.readline()
+        if not header or header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        data = self._proc.stdout.read(int(header.split()[-1]))
+        self._proc.stdout.read(1)  # trailing newline
+        return data
+
+    def close(self):
+        """Terminate the batch process."""
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc.stdout.close()
+            self._proc = None
+
+
+def iter_blob_lines(obj: str):
+    """
+    Yield the lines (bytes) of a blob such as "origin/main:path/file.jsonl".
+
+    Streams `git cat-file blob` stdout so peak memory stays at one buffered
+    block however large the blob is. Yields nothing if the object is missing.
+    """
+    proc = subprocess.Popen(
+        ["git", "cat-file", "blob", obj],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        yield from proc.stdout
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+
 def get_current_branch() -> str:
     """Get current git branch name."""
     return git_output("branch", "--show-current")
@@ -171,10 +279,10 @@ def get_short_commit() -> str:
 
 def get_remote_head(branch: str) -> Optional[str]:
     """Get remote HEAD for a branch, or None if doesn't exist."""
-    try:
-        return git_output("rev-parse", f"origin/{branch}")
-    except subprocess.CalledProcessError:
+    result = run_git("rev-parse", "--verify", "--quiet", f"refs/remotes/origin/{branch}", check=False)
+    if result.returncode != 0:
         return None
+    return result.stdout.strip()
 
 
 def safe_commit(message: str, files: list = None) -> tuple[bool, str, str]:
@@ -212,8 +320,37 @@ Details:
         return False, "", error_msg
 
 
+# With BRAIN_DEFER_PUSH set, pushes are queued here as (repo dir, branch) and
+# run once each when the process exits.
+_pending_pushes: dict = {}
+
+
+def _flush_pending_pushes():
+    """Run the pushes queued by safe_push under BRAIN_DEFER_PUSH."""
+    pending = list(_pending_pushes)
+    _pending_pushes.clear()
+    for repo_dir, branch in pending:
+        args = ("push", "-u", "origin", branch) if branch else ("push",)
+        try:
+            run_git("-C", repo_dir, *args)
+            print(f"\U0001F4E4 Pushed to origin/{branch or 'current'}")
+        except subprocess.CalledProcessError as e:
+            print(f"\u26A0\uFE0F  Push failed: exit code {e.returncode}", file=sys.stderr)
+
+
 def safe_push(branch: str = None) -> bool:
-    """Push to origin, handling missing remote gracefully."""
+    """
+    Push to origin, handling missing remote gracefully.
+
+    If BRAIN_DEFER_PUSH is set, the push is queued instead and repeated
+    pushes of the same branch collapse into one push at process exit.
+    """
+    if os.environ.get("BRAIN_DEFER_PUSH"):
+        if not _pending_pushes:
+            atexit.register(_flush_pending_pushes)
+        _pending_pushes[(os.getcwd(), branch)] = None
+        return True
+
     try:
         if branch:
             run_git("push", "-u", "origin", branch)
@@ -230,15 +367,27 @@ def safe_push(branch: str = None) -> bool:
 # Identity Management
 # =============================================================================
 
+# Parsed self.json keyed by absolute path; reused while (mtime, size, inode)
+# are unchanged so chained load_identity() calls skip the JSON parse.
+_identity_cache: dict = {}
+
+
 def load_identity() -> Optional[dict]:
-    """Load participant identity."""
-    if not SELF_FILE.exists():
-        return None
+    """Load participant identity (memoized until self.json changes)."""
     try:
-        with open(SELF_FILE) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        st = os.stat(SELF_FILE)
+    except OSError:
         return None
+    key = os.path.abspath(SELF_FILE)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _identity_cache.get(key)
+    if cached is None or cached[0] != stamp:
+        data = load_json(SELF_FILE)
+        if data is None:
+            return None
+        cached = _identity_cache[key] = (stamp, data)
+    # Callers update the identity in place before save_identity(), so hand out a copy
+    return dict(cached[1])
 
 
 def require_identity() -> dict:
@@ -261,52 +410,115 @@ def get_identity_name() -> str:
 def save_identity(identity: dict):
     """Save identity to file."""
     ensure_brain_dirs()
-    with open(SELF_FILE, "w") as f:
-        json.dump(identity, f, indent=2)
-        f.write("\n")
-    os.chmod(SELF_FILE, 0o600)
+    _atomic_write(SELF_FILE, json.dumps(identity, indent=2) + "\n", mode=0o600)
+    _identity_cache.pop(os.path.abspath(SELF_FILE), None)
 
 
 # =============================================================================
 # Event Logging
 # =============================================================================
 
+def event_line(event: dict) -> bytes:
+    """Encode an event as one compact JSONL record (no separator padding)."""
+    return json.dumps(event, separators=(",", ":")).encode() + b"\n"
+
+
 def append_event(event: dict):
     """Append event to events.jsonl (local log)."""
     ensure_brain_dirs()
-    with open(EVENTS_FILE, "a") as f:
-        f.write(json.dumps(event) + "\n")
+    with open(EVENTS_FILE, "ab") as f:
+        f.write(event_line(event))
+
+
+_TAIL_BLOCK = 1 << 16
+
+
+def _tail_lines(filepath: Path, limit: int) -> list[bytes]:
+    """Return the last `limit` non-blank lines, reading 64 KiB blocks backwards from EOF."""
+    chunks: list[bytes] = []
+    with open(filepath, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        newlines = 0
+        while pos > 0:
+            size = min(_TAIL_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            chunk = f.read(size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            if newlines <= limit:
+                continue
+            lines = b"".join(reversed(chunks)).split(b"\n")
+            if pos > 0:
+                lines = lines[1:]  # first line may be cut mid-record
+            lines = [line for line in lines if line.strip()]
+            if len(lines) >= limit:
+                return lines[-limit:]
+    lines = b"".join(reversed(chunks)).split(b"\n")
+    return [line for line in lines if line.strip()][-limit:]
 
 
 def read_events(limit: int = 100) -> list:
-    """Read events from local log."""
+    """
+    Read the last `limit` events from local log.
+
+    The file is scanned backwards from the end, so only the blocks holding the
+    trailing `limit` lines are read and parsed. A non-positive limit reads all.
+    """
     if not EVENTS_FILE.exists():
         return []
-    with open(EVENTS_FILE) as f:
-        events = [json.loads(line) for line in f if line.strip()]
-    return events[-limit:]
+    if limit > 0:
+        lines = _tail_lines(EVENTS_FILE, limit)
+    else:
+        with open(EVENTS_FILE, "rb") as f:
+            lines = [line for line in f if line.strip()]
+    return [json.loads(line) for line in lines]
 
 
 # =============================================================================
 # File I/O Helpers
 # =============================================================================
 
-def save_json(filepath: Path, data: dict):
-    """Save dict to JSON file with trailing newline."""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+def _atomic_write(filepath: Path, text: str, mode: Optional[int] = None):
+    """
+    Write text to a sibling temp file in one call, then os.replace() it in.
+
+    Readers never observe a partially written file, even if interrupted.
+    """
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_json(filepath: Path, data: dict, ensure_parent: bool = True):
+    """
+    Save dict to JSON file with trailing newline.
+
+    Pass ensure_parent=False when the caller has already created the parent
+    directory, to skip the per-file mkdir.
+    """
+    if ensure_parent:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(filepath, json.dumps(data, indent=2) + "\n")
 
 
 def load_json(filepath: Path) -> Optional[dict]:
     """Load JSON file or return None."""
-    if not filepath.exists():
-        return None
     try:
-        with open(filepath) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(filepath, "rb") as f:
+            return json.loads(f.read())
+    except (ValueError, OSError):
+        # Missing/unreadable file, invalid JSON, or invalid UTF-8
         return None
 
 
@@ -314,19 +526,55 @@ def load_json(filepath: Path) -> Optional[dict]:
 # Message Saving (shared by send and other commands)
 # =============================================================================
 
-def save_message(identity: dict, msg_type: str, content: dict) -> Path:
-    """Save a message file and return its path."""
+def save_message(identity: dict, msg_type: str, content: dict,
+                 head_commit: Optional[str] = None) -> Path:
+    """
+    Save a message file and return its path.
+
+    Pass `head_commit` when the caller already resolved HEAD to skip a second
+    `git rev-parse`.
+    """
     ensure_brain_dirs()
+    if head_commit is None:
+        head_commit = _head_commit_or_none()
+    return _write_message(identity, msg_type, content, head_commit)
 
-    ts = timestamp_filename()
-    filename = f"{ts}-{msg_type}.json"
-    filepath = MESSAGES_DIR / identity["short_name"] / filename
-    filepath.parent.mkdir(parents=True, exist_ok=True)
 
+def save_messages_bulk(identity: dict, msgs: list) -> list:
+    """
+    Save several (msg_type, content) messages and return their paths.
+
+    Directory setup and the HEAD lookup happen once for the whole batch, so
+    callers can follow up with a single safe_commit over all returned paths.
+    """
+    ensure_brain_dirs()
+    (MESSAGES_DIR / identity["short_name"]).mkdir(parents=True, exist_ok=True)
+    head_commit = _head_commit_or_none()
+    paths = []
+    for msg_type, content in msgs:
+        paths.append(_write_message(identity, msg_type, content, head_commit,
+                                    taken=paths, ensure_parent=False))
+    return paths
+
+
+def _head_commit_or_none() -> Optional[str]:
+    """HEAD commit hash, or None outside a repo / before the first commit."""
     try:
-        head_commit = get_head_commit()
+        return get_head_commit()
     except subprocess.CalledProcessError:
-        head_commit = None
+        return None
+
+
+def _write_message(identity: dict, msg_type: str, content: dict,
+                   head_commit: Optional[str], taken: list = (),
+                   ensure_parent: bool = True) -> Path:
+    """Write one message file; `taken` holds paths already used in this batch."""
+    ts = timestamp_filename()
+    filepath = MESSAGES_DIR / identity["short_name"] / f"{ts}-{msg_type}.json"
+    suffix = 1
+    while filepath in taken:
+        filepath = MESSAGES_DIR / identity["short_name"] / f"{ts}-{msg_type}-{suffix}.json"
+        suffix += 1
 
     message = {
         "type": msg_type,
@@ -337,5 +585,5 @@ def save_message(identity: dict, msg_type: str, content: dict) -> Path:
         **content
     }
 
-    save_json(filepath, message)
+    save_json(filepath, message, ensure_parent=ensure_parent)
     return filepath
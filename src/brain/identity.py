@@ -4,10 +4,14 @@ brain/identity.py - Identity and Key Management
 Single Responsibility: Handles identity creation, keys, and status display.
 """
 
+import hashlib
+import json
 import os
 import re
 import subprocess
 import sys
+import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -16,46 +20,79 @@ from .core import (
     now_iso, generate_color_emotion_id, get_agent_emoji,
     ensure_brain_dirs, ensure_key_dirs,
     get_current_branch, get_head_commit,
-    load_identity, save_identity,
+    load_identity, require_identity, save_identity,
     safe_commit, safe_push,
     EVENTS_FILE, CLAIMS_DIR,
 )
 
 
 # =============================================================================
-# Key Generation (Ed25519) - Uses OpenSSL (no external Python dependencies)
+# Key Generation (Ed25519) - In-process if `cryptography` is installed,
+# otherwise system OpenSSL (no required external Python dependencies)
 # =============================================================================
 
 def generate_key_pair(identity_name: str) -> tuple[str, str]:
     """
-    Generate an Ed25519 key pair for signing using OpenSSL.
+    Generate an Ed25519 key pair for signing.
     Returns (private_key_pem, public_key_pem).
 
-    Uses system OpenSSL to avoid external Python package dependencies.
+    Uses the optional `cryptography` package in-process when available;
+    falls back to piping through system OpenSSL (no temp files).
     """
-    import tempfile
+    return _key_pair_generator()()
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        priv_path = Path(tmpdir) / "private.pem"
-        pub_path = Path(tmpdir) / "public.pem"
 
-        # Generate private key
-        result = subprocess.run(
-            ["openssl", "genpkey", "-algorithm", "Ed25519", "-out", str(priv_path)],
-            capture_output=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"OpenSSL key generation failed: {result.stderr.decode()}")
+def generate_key_pairs(full_ids: list[str]) -> list[tuple[str, str, str]]:
+    """
+    Generate one Ed25519 key pair per identity.
+    Returns [(full_id, private_key_pem, public_key_pem), ...].
+
+    The backend is resolved once for the whole batch, so provisioning many
+    identities in one process shares the import/setup cost.
+    """
+    generate = _key_pair_generator()
+    return [(full_id, *generate()) for full_id in full_ids]
+
 
-        # Extract public key
-        result = subprocess.run(
-            ["openssl", "pkey", "-in", str(priv_path), "-pubout", "-out", str(pub_path)],
-            capture_output=True
+def _key_pair_generator():
+    """Return a zero-arg callable producing (private_pem, public_pem)."""
+    try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+        from cryptography.hazmat.primitives.serialization import (
+            Encoding, NoEncryption, PrivateFormat, PublicFormat,
         )
-        if result.returncode != 0:
-            raise RuntimeError(f"OpenSSL public key extraction failed: {result.stderr.decode()}")
+    except ImportError:
+        return _generate_key_pair_openssl
+
+    def generate() -> tuple[str, str]:
+        private_key = Ed25519PrivateKey.generate()
+        private_pem = private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+        public_pem = private_key.public_key().public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+        return private_pem.decode(), public_pem.decode()
+
+    return generate
+
+
+def _generate_key_pair_openssl() -> tuple[str, str]:
+    """Generate an Ed25519 key pair via system OpenSSL, passing PEMs over pipes."""
+    # Generate private key
+    result = subprocess.run(
+        ["openssl", "genpkey", "-algorithm", "Ed25519"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"OpenSSL key generation failed: {result.stderr.decode()}")
+    private_pem = result.stdout
+
+    # Extract public key
+    result = subprocess.run(
+        ["openssl", "pkey", "-pubout"],
+        input=private_pem, capture_output=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"OpenSSL public key extraction failed: {result.stderr.decode()}")
 
-        return priv_path.read_text(), pub_path.read_text()
+    return private_pem.decode(), result.stdout.decode()
 
 
 def save_key_pair(full_id: str, private_pem: str, public_pem: str) -> tuple[Path, Path]:
@@ -97,34 +134,117 @@ def load_public_key(full_id: str) -> Optional[str]:
 
 
 def get_public_key_fingerprint(public_pem: str) -> str:
-    """Get a short fingerprint of a public key."""
-    import hashlib
-    import base64
-    hash_bytes = hashlib.sha256(public_pem.encode('utf-8')).digest()
-    return base64.b64encode(hash_bytes).decode('utf-8')[:16]
+    """Get a short fingerprint of a public key (16 hex chars of its SHA-256)."""
+    return hashlib.sha256(public_pem.encode('utf-8')).digest()[:8].hex()
+
+
+_FINGERPRINT_PATTERN = re.compile(r"^[0-9a-f]{16}$")
+
+
+def _hex_fingerprint(identity: dict):
+    """
+    Return the identity's fingerprint in hex form, read-only.
+
+    A legacy base64 value stored in self.json is recomputed from the public
+    key file when it exists; otherwise the stored value is returned as-is.
+    """
+    stored = identity.get("public_key_fingerprint", "N/A")
+    if not stored or stored == "N/A" or _FINGERPRINT_PATTERN.match(stored):
+        return stored
+    public_path = PUBLIC_KEYS_DIR / f"{identity.get('full_id', identity['short_name'])}.pem"
+    if public_path.exists():
+        return load_public_key_file(public_path)[1]
+    return stored
+
+
+def _migrate_fingerprint(identity: dict) -> dict:
+    """Replace a legacy base64 fingerprint in self.json with the hex form."""
+    fingerprint = _hex_fingerprint(identity)
+    if fingerprint != identity.get("public_key_fingerprint", "N/A"):
+        identity["public_key_fingerprint"] = fingerprint
+        save_identity(identity)
+    return identity
+
+
+@lru_cache(maxsize=256)
+def _load_pem_cached(path_str: str, mtime_ns: int, size: int, ino: int) -> tuple[str, str]:
+    """Read a PEM file and fingerprint it; keyed on its stat stamp so rewrites invalidate."""
+    public_pem = Path(path_str).read_text()
+    return public_pem, get_public_key_fingerprint(public_pem)
+
+
+def load_public_key_file(path: Path) -> tuple[str, str]:
+    """Return (public_pem, fingerprint) for a key file, cached per absolute path and stamp."""
+    path = path.resolve()
+    st = path.stat()
+    return _load_pem_cached(os.fspath(path), st.st_mtime_ns, st.st_size, st.st_ino)
 
 
 # =============================================================================
 # Commands
 # =============================================================================
 
+_HR = "\u2500" * 57
+
+# cmd_status frame: fixed geometry, so rows are precompiled templates filled
+# via format_map and the whole box is emitted with one write.
+_STATUS_TEMPLATE = (
+    "\n"
+    "\u250C{hr}\u2510\n"
+    "\u2502                    \U0001F9E0 BRAIN STATUS                      \u2502\n"
+    "\u251C{hr}\u2524\n"
+    "{identity_rows}"
+    "\u2502  Branch:      {branch:<42} \u2502\n"
+    "\u2502  HEAD:        {head:<42} \u2502\n"
+    "\u2502  Events:      {event_count:<42} \u2502\n"
+    "\u251C{hr}\u2524\n"
+    "\u2502  Active Claims:                                        \u2502\n"
+    "{claim_rows}"
+    "\u2514{hr}\u2518\n"
+    "\n"
+)
+_STATUS_IDENTITY = (
+    "\u2502  {emoji} Identity: @{short_name:<39} \u2502\n"
+    "\u2502  Full ID:     {full_id:<42} \u2502\n"
+)
+_STATUS_MOOD = (
+    "\u2502  \U0001F3A8 Color:    {color:<42} \u2502\n"
+    "\u2502  \U0001F4AB Emotion:  {emotion:<42} \u2502\n"
+)
+_STATUS_KEYS_ON = (
+    "\u2502  \U0001F511 Keys:     \u2705 Configured                            \u2502\n"
+    "\u2502  Fingerprint: {fingerprint:<42} \u2502\n"
+)
+_STATUS_KEYS_OFF = "\u2502  \U0001F511 Keys:     \u274C Not configured                         \u2502\n"
+_STATUS_NO_IDENTITY = "\u2502  Identity:    \u274C Not initialized                        \u2502\n"
+_STATUS_CLAIM = "\u2502    Phase {phase}: {dev:<44} \u2502\n"
+_STATUS_NO_CLAIMS = "\u2502    (none)                                               \u2502\n"
+
 SHORT_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_-]{1,23}$")
 
+_NAME_START_CHARS = "abcdefghijklmnopqrstuvwxyz"
+_NAME_CHARS = _NAME_START_CHARS + "0123456789_-"
+
 
 def validate_name(name: str) -> bool:
-    """Validate short name format."""
+    """
+    Validate short name format (same rule as SHORT_NAME_PATTERN).
+
+    str.strip() with the allowed set does the per-character table check in C;
+    anything left over is a disallowed character. Unlike the regex's `$`, a
+    trailing newline is rejected.
+    """
     if not name or len(name) < 2 or len(name) > 24:
         return False
-    return bool(SHORT_NAME_PATTERN.match(name))
+    return name[0] in _NAME_START_CHARS and not name.strip(_NAME_CHARS)
 
 
 def cmd_init(args):
     """Initialize participant identity."""
-    import uuid
-
     existing = load_identity()
 
     if existing and not getattr(args, 'reset', False):
+        _migrate_fingerprint(existing)
         print("\u2705 Identity already exists:")
         cmd_status(args)
         return
@@ -206,60 +326,52 @@ def cmd_status(args):
     """Show current status."""
     identity = load_identity()
 
-    print()
-    print("\u250C" + "\u2500" * 57 + "\u2510")
-    print("\u2502" + "                    \U0001F9E0 BRAIN STATUS                      " + "\u2502")
-    print("\u251C" + "\u2500" * 57 + "\u2524")
-
     if identity:
-        emoji = identity.get("emoji", get_agent_emoji(identity["short_name"]))
-        print(f"\u2502  {emoji} Identity: @{identity['short_name']:<39} \u2502")
-        print(f"\u2502  Full ID:     {identity['full_id']:<42} \u2502")
-
-        color = identity.get("color")
-        emotion = identity.get("emotion")
-        if color and emotion:
-            print(f"\u2502  \U0001F3A8 Color:    {color:<42} \u2502")
-            print(f"\u2502  \U0001F4AB Emotion:  {emotion:<42} \u2502")
-
-        has_keys = identity.get("has_keys", False)
-        if has_keys:
-            fingerprint = identity.get("public_key_fingerprint", "N/A")
-            print(f"\u2502  \U0001F511 Keys:     \u2705 Configured                            \u2502")
-            print(f"\u2502  Fingerprint: {fingerprint:<42} \u2502")
-        else:
-            print(f"\u2502  \U0001F511 Keys:     \u274C Not configured                         \u2502")
+        fields = {
+            "emoji": identity.get("emoji", get_agent_emoji(identity["short_name"])),
+            "short_name": identity["short_name"],
+            "full_id": identity["full_id"],
+            "color": identity.get("color"),
+            "emotion": identity.get("emotion"),
+            "fingerprint": _hex_fingerprint(identity),
+        }
+        identity_rows = _STATUS_IDENTITY.format_map(fields)
+        if fields["color"] and fields["emotion"]:
+            identity_rows += _STATUS_MOOD.format_map(fields)
+        identity_rows += (_STATUS_KEYS_ON if identity.get("has_keys", False) else _STATUS_KEYS_OFF).format_map(fields)
     else:
-        print("\u2502  Identity:    \u274C Not initialized                        \u2502")
-
-    print(f"\u2502  Branch:      {get_current_branch():<42} \u2502")
-    print(f"\u2502  HEAD:        {get_head_commit()[:8]:<42} \u2502")
+        identity_rows = _STATUS_NO_IDENTITY
 
-    # Count events
+    # Count events (newline count per 64 KiB block; each event is one line,
+    # plus a final line that lacks its trailing newline)
     event_count = 0
     if EVENTS_FILE.exists():
-        with open(EVENTS_FILE) as f:
-            event_count = sum(1 for _ in f)
-    print(f"\u2502  Events:      {event_count:<42} \u2502")
-
-    # Show active claims
-    print("\u251C" + "\u2500" * 57 + "\u2524")
-    print("\u2502  Active Claims:                                        \u2502")
+        with open(EVENTS_FILE, "rb") as f:
+            last = b"\n"
+            while chunk := f.read(1 << 16):
+                event_count += chunk.count(b"\n")
+                last = chunk[-1:]
+            if last != b"\n":
+                event_count += 1
 
     claims = list(CLAIMS_DIR.glob("*-claim.json")) if CLAIMS_DIR.exists() else []
     if claims:
-        import json
+        claim_rows = ""
         for claim_file in claims[:5]:
             with open(claim_file) as f:
                 claim = json.load(f)
-            phase = claim.get("phase", "?")
-            dev = claim.get("developer", "?")
-            print(f"\u2502    Phase {phase}: {dev:<44} \u2502")
+            claim_rows += _STATUS_CLAIM.format(phase=claim.get("phase", "?"), dev=claim.get("developer", "?"))
     else:
-        print("\u2502    (none)                                               \u2502")
+        claim_rows = _STATUS_NO_CLAIMS
 
-    print("\u2514" + "\u2500" * 57 + "\u2518")
-    print()
+    sys.stdout.write(_STATUS_TEMPLATE.format_map({
+        "hr": _HR,
+        "identity_rows": identity_rows,
+        "branch": get_current_branch(),
+        "head": get_head_commit()[:8],
+        "event_count": event_count,
+        "claim_rows": claim_rows,
+    }))
 
 
 def cmd_keys(args):
@@ -268,14 +380,15 @@ def cmd_keys(args):
     subcommand = getattr(args, 'subcommand', 'show') or 'show'
 
     if subcommand == "show":
-        print()
-        print("\u250C" + "\u2500" * 57 + "\u2510")
-        print("\u2502" + "                    \U0001F511 KEY STATUS                        " + "\u2502")
-        print("\u251C" + "\u2500" * 57 + "\u2524")
+        lines = [""]
+        lines.append("\u250C" + _HR + "\u2510")
+        lines.append("\u2502" + "                    \U0001F511 KEY STATUS                        " + "\u2502")
+        lines.append("\u251C" + _HR + "\u2524")
 
         if not identity:
-            print("\u2502  \u274C No identity found. Run: brain init               \u2502")
-            print("\u2514" + "\u2500" * 57 + "\u2518")
+            lines.append("\u2502  \u274C No identity found. Run: brain init               \u2502")
+            lines.append("\u2514" + _HR + "\u2518")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
         short_name = identity["short_name"]
@@ -283,37 +396,36 @@ def cmd_keys(args):
 
         private_path = PRIVATE_KEYS_DIR / f"{full_id}.pem"
         if private_path.exists():
-            print(f"\u2502  Private Key: \u2705 Found                                  \u2502")
-            print(f"\u2502    {str(private_path):<53} \u2502")
+            lines.append(f"\u2502  Private Key: \u2705 Found                                  \u2502")
+            lines.append(f"\u2502    {str(private_path):<53} \u2502")
         else:
-            print(f"\u2502  Private Key: \u274C Not found                             \u2502")
+            lines.append(f"\u2502  Private Key: \u274C Not found                             \u2502")
 
         public_path = PUBLIC_KEYS_DIR / f"{full_id}.pem"
         if public_path.exists():
-            print(f"\u2502  Public Key:  \u2705 Found                                  \u2502")
-            print(f"\u2502    {str(public_path):<53} \u2502")
-            public_pem = public_path.read_text()
-            fingerprint = get_public_key_fingerprint(public_pem)
-            print(f"\u2502  Fingerprint: {fingerprint:<42} \u2502")
+            lines.append(f"\u2502  Public Key:  \u2705 Found                                  \u2502")
+            lines.append(f"\u2502    {str(public_path):<53} \u2502")
+            _, fingerprint = load_public_key_file(public_path)
+            lines.append(f"\u2502  Fingerprint: {fingerprint:<42} \u2502")
         else:
-            print(f"\u2502  Public Key:  \u274C Not found                             \u2502")
+            lines.append(f"\u2502  Public Key:  \u274C Not found                             \u2502")
 
-        print("\u251C" + "\u2500" * 57 + "\u2524")
-        print("\u2502  Known Participants (Public Keys):                      \u2502")
+        lines.append("\u251C" + _HR + "\u2524")
+        lines.append("\u2502  Known Participants (Public Keys):                      \u2502")
 
         if PUBLIC_KEYS_DIR.exists():
             for key_file in sorted(PUBLIC_KEYS_DIR.glob("*.pem")):
                 key_id = key_file.stem  # full_id: name-color-emotion
-                pub_pem = key_file.read_text()
-                fp = get_public_key_fingerprint(pub_pem)
+                _, fp = load_public_key_file(key_file)
                 is_me = " (you)" if key_id == full_id else ""
                 # Truncate long IDs for display
                 display_id = key_id[:24] if len(key_id) > 24 else key_id
-                print(f"\u2502    {display_id:<24} {fp:<16}{is_me:<8} \u2502")
+                lines.append(f"\u2502    {display_id:<24} {fp:<16}{is_me:<8} \u2502")
         else:
-            print("\u2502    (none)                                              \u2502")
+            lines.append("\u2502    (none)                                              \u2502")
 
-        print("\u2514" + "\u2500" * 57 + "\u2518")
+        lines.append("\u2514" + _HR + "\u2518")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif subcommand == "verify":
         target = getattr(args, 'target', None)
@@ -326,15 +438,13 @@ def cmd_keys(args):
             print(f"\u274C No public key found for @{target}")
             sys.exit(1)
 
-        public_pem = public_path.read_text()
-        fingerprint = get_public_key_fingerprint(public_pem)
+        _, fingerprint = load_public_key_file(public_path)
 
         print(f"\u2705 Public key for @{target}")
         print(f"   Fingerprint: {fingerprint}")
         print(f"   File: {public_path}")
 
     elif subcommand == "regenerate":
-        from .core import require_identity
         identity = require_identity()
         full_id = identity["full_id"]
 
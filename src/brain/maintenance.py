@@ -4,8 +4,11 @@ brain/maintenance.py - Maintenance commands for Brain Protocol
 Provides commands for resetting and cleaning up brain state.
 """
 
+import os
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from brain.core import (
@@ -19,6 +22,10 @@ from brain.core import (
     KEYS_DIR,
 )
 
+# Directories with more entries than this are cleared with a thread pool
+_PARALLEL_DELETE_THRESHOLD = 16
+_DELETE_WORKERS = 8
+
 
 def cmd_reset(args):
     """
@@ -99,19 +106,16 @@ def _show_dry_run(targets: dict):
 
     cleared_count = 0
     for name, path in targets.items():
-        exists = path.exists() if isinstance(path, Path) else Path(path).exists()
-        status = "\u2705 exists" if exists else "\u2796 not present"
+        exists, is_dir, file_count = _path_summary(str(path))
 
         if exists:
             cleared_count += 1
-            if path.is_dir() if isinstance(path, Path) else Path(path).is_dir():
-                # Count files in directory
-                file_count = sum(1 for _ in Path(path).rglob('*') if _.is_file())
+            if is_dir:
                 print(f"  \u2022 {name}: {path} ({file_count} files)")
             else:
                 print(f"  \u2022 {name}: {path}")
         else:
-            print(f"  \u2022 {name}: {status}")
+            print(f"  \u2022 {name}: \u2796 not present")
 
     print()
     if cleared_count > 0:
@@ -121,6 +125,32 @@ def _show_dry_run(targets: dict):
         print("\u2139\uFE0F  Nothing to reset")
 
 
+def _path_summary(path: str) -> tuple[bool, bool, int]:
+    """
+    Return (exists, is_dir, file_count) for a path with one initial stat.
+
+    Directories are walked with os.scandir, whose DirEntry type info comes
+    from the directory read itself, so descendants need no extra stat.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False, 0
+    if not stat.S_ISDIR(st.st_mode):
+        return True, False, 0
+
+    file_count = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    file_count += 1
+    return True, True, file_count
+
+
 def _perform_reset(targets: dict):
     """Perform the actual reset operation."""
     cleared = []
@@ -138,11 +168,14 @@ def _perform_reset(targets: dict):
         try:
             if path.is_dir():
                 # Remove directory contents but keep the directory
-                for item in path.iterdir():
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
+                items = list(path.iterdir())
+                if len(items) > _PARALLEL_DELETE_THRESHOLD:
+                    # Overlap unlink latency across threads for large dirs
+                    with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+                        list(executor.map(_remove_item, items))
+                else:
+                    for item in items:
+                        _remove_item(item)
                 cleared.append(name)
                 print(f"  \u2705 Cleared {name}")
             else:
@@ -160,3 +193,11 @@ def _perform_reset(targets: dict):
             print(f"   Skipped {len(skipped)} (not present): {', '.join(skipped)}")
     else:
         print("\u2139\uFE0F  Nothing to reset (no targets present)")
+
+
+def _remove_item(item: Path):
+    """Remove a file or directory tree."""
+    if item.is_dir() and not item.is_symlink():
+        shutil.rmtree(item)
+    else:
+        item.unlink()
@@ -9,17 +9,20 @@ Single Responsibility: Handles all messaging operations.
 """
 
 import json
-import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import textwrap
+from contextlib import contextmanager
 from pathlib import Path
 
 from .core import (
     BRAIN_DIR, MESSAGES_DIR, EVENTS_FILE, EVENTS_BRANCH,
-    now_iso, ensure_brain_dirs,
-    run_git, git_output, get_current_branch, get_head_commit,
+    now_iso,
+    run_git, git_output, get_current_branch, get_head_commit, iter_blob_lines,
     require_identity, load_identity,
-    append_event, read_events,
+    append_event, event_line, read_events,
     save_message, safe_commit, safe_push, save_json,
 )
 
@@ -37,8 +40,10 @@ def cmd_send(args):
         print("\u274C Message cannot be empty")
         sys.exit(1)
 
+    head_commit = get_head_commit()
+
     # Save message file
-    filepath = save_message(identity, "message", {"body": message})
+    filepath = save_message(identity, "message", {"body": message}, head_commit)
 
     # Append to local events
     append_event({
@@ -46,7 +51,7 @@ def cmd_send(args):
         "from": identity["short_name"],
         "body": message,
         "ts": now_iso(),
-        "head_commit": get_head_commit()
+        "head_commit": head_commit
     })
 
     # Git commit
@@ -64,11 +69,92 @@ def cmd_send(args):
         safe_push(get_current_branch())
 
 
+def _checked_out_events_worktree():
+    """Return the path of a worktree that already has the events branch checked out, or None."""
+    result = run_git("worktree", "list", "--porcelain", check=False)
+    path = None
+    for line in result.stdout.splitlines():
+        if line.startswith("worktree "):
+            path = line[len("worktree "):]
+        elif line == f"branch refs/heads/{EVENTS_BRANCH}":
+            return Path(path)
+    return None
+
+
+def _merge_remote_events(worktree: Path):
+    """
+    Merge the fetched origin events branch into `worktree`.
+
+    A failed merge (concurrent appends to shared-events.jsonl) is aborted so
+    no half-merged tree is committed or pushed, and reported as an error.
+    """
+    result = run_git("-C", str(worktree), "merge", "--no-edit", f"origin/{EVENTS_BRANCH}", check=False)
+    if result.returncode != 0:
+        run_git("-C", str(worktree), "merge", "--abort", check=False)
+        raise subprocess.CalledProcessError(
+            result.returncode, result.args, result.stdout,
+            f"merging origin/{EVENTS_BRANCH} failed and was aborted; "
+            f"resolve {EVENTS_BRANCH} manually and retry\n{(result.stderr or '').strip()}"
+        )
+
+
+@contextmanager
+def _events_worktree():
+    """
+    Check out the shared events branch in a temporary worktree.
+
+    The user's working tree, index and current branch are never touched, so
+    no stash or checkout round-trip is needed. If the branch is already
+    checked out (git allows only one worktree per branch), that worktree is
+    used instead. Yields the worktree path.
+    """
+    # Fetch events branch
+    run_git("fetch", "origin", EVENTS_BRANCH, check=False)
+
+    # Check if events branch exists (remotely or from an earlier local announce)
+    remote_exists = run_git(
+        "rev-parse", "--verify", "--quiet", f"refs/remotes/origin/{EVENTS_BRANCH}", check=False
+    ).returncode == 0
+    local_exists = run_git(
+        "rev-parse", "--verify", "--quiet", f"refs/heads/{EVENTS_BRANCH}", check=False
+    ).returncode == 0
+
+    existing = _checked_out_events_worktree() if local_exists else None
+    if existing is not None:
+        if remote_exists:
+            _merge_remote_events(existing)
+        yield existing
+        return
+
+    tmp_dir = tempfile.mkdtemp(prefix="brain-events-")
+    worktree = Path(tmp_dir) / "worktree"
+    try:
+        if local_exists or remote_exists:
+            # Existing local branch, or DWIM tracking branch from origin
+            run_git("worktree", "add", str(worktree), EVENTS_BRANCH)
+            if remote_exists:
+                # Refs are shared with the main repo, so merge what was just fetched
+                _merge_remote_events(worktree)
+        else:
+            # First announcement: start an empty orphan branch
+            run_git("worktree", "add", "--no-checkout", "--detach", str(worktree))
+            run_git("-C", str(worktree), "checkout", "--orphan", EVENTS_BRANCH)
+            run_git("-C", str(worktree), "read-tree", "--empty")
+
+        yield worktree
+    finally:
+        run_git("worktree", "remove", "--force", str(worktree), check=False)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        run_git("worktree", "prune", check=False)
+
+
 def cmd_announce(args):
     """
     Announce a message to all participants via shared events branch.
 
-    Pushes to brain/events branch which all participants can fetch.
+    Pushes to brain/events branch which all participants can fetch. The
+    branch is updated in a temporary worktree, leaving the current checkout
+    untouched.
     """
     identity = require_identity()
     message = " ".join(args.message)
@@ -82,32 +168,6 @@ def cmd_announce(args):
 
     print(f"{emoji} Announcing to all participants...")
 
-    # Stash changes
-    stash_ts = now_iso().replace(":", "-").replace(".", "-")
-    stash_name = f"brain-announce-{stash_ts}"
-    stash_result = run_git("stash", "push", "-u", "-m", stash_name, check=False)
-    has_stash = "No local changes" not in stash_result.stdout
-
-    # Fetch events branch
-    run_git("fetch", "origin", EVENTS_BRANCH, check=False)
-
-    # Check if events branch exists
-    result = run_git("branch", "-r", "--list", f"origin/{EVENTS_BRANCH}", check=False)
-    events_branch_exists = bool(result.stdout.strip())
-
-    # Checkout events branch
-    if events_branch_exists:
-        run_git("checkout", EVENTS_BRANCH, check=False)
-        run_git("pull", "origin", EVENTS_BRANCH, check=False)
-    else:
-        try:
-            run_git("checkout", "--orphan", EVENTS_BRANCH)
-            run_git("rm", "-rf", ".", check=False)
-        except subprocess.CalledProcessError:
-            run_git("checkout", EVENTS_BRANCH)
-
-    ensure_brain_dirs()
-
     # Get head from original branch
     try:
         original_head = git_output("rev-parse", original_branch)
@@ -124,46 +184,39 @@ def cmd_announce(args):
         "head_commit": original_head
     }
 
-    # Append to shared events
-    shared_events_file = BRAIN_DIR / "shared-events.jsonl"
-    with open(shared_events_file, "a") as f:
-        f.write(json.dumps(event) + "\n")
-
-    run_git("add", str(shared_events_file))
-
-    commit_msg = f"\U0001F4E2 {identity['short_name']}: {message[:50]}{'...' if len(message) > 50 else ''}"
-
-    env = os.environ.copy()
-    env["SKIP_SIMPLE_GIT_HOOKS"] = "1"
-
     try:
-        result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            capture_output=True, text=True, env=env
-        )
-        if result.returncode == 0:
-            print("\u2705 Announcement committed")
-        else:
-            print("\u26A0\uFE0F  No changes to commit")
-    except subprocess.CalledProcessError:
-        print("\u26A0\uFE0F  No changes to commit")
+        with _events_worktree() as worktree:
+            # Append to shared events
+            shared_events_file = worktree / BRAIN_DIR / "shared-events.jsonl"
+            shared_events_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(shared_events_file, "ab") as f:
+                f.write(event_line(event))
+
+            run_git("-C", str(worktree), "add", str(BRAIN_DIR / "shared-events.jsonl"))
+
+            commit_msg = f"\U0001F4E2 {identity['short_name']}: {message[:50]}{'...' if len(message) > 50 else ''}"
+
+            result = run_git(
+                "-C", str(worktree), "commit", "-m", commit_msg,
+                check=False, env_extra={"SKIP_SIMPLE_GIT_HOOKS": "1"}
+            )
+            if result.returncode == 0:
+                print("\u2705 Announcement committed")
+            else:
+                print("\u26A0\uFE0F  No changes to commit")
 
-    # Push
+    except subprocess.CalledProcessError as e:
+        details = (e.stderr or "").strip() or f"exit code {e.returncode}"
+        print(f"\u274C Could not prepare {EVENTS_BRANCH} worktree: {details}", file=sys.stderr)
+        sys.exit(1)
+
+    # Push from the main repo (shares the branch ref; relative remote URLs resolve here)
     try:
         run_git("push", "-u", "origin", EVENTS_BRANCH)
         print(f"\U0001F4E4 Pushed to origin/{EVENTS_BRANCH}")
     except subprocess.CalledProcessError as e:
         print(f"\u26A0\uFE0F  Push failed: {e}", file=sys.stderr)
 
-    # Return to original branch
-    checkout_result = run_git("checkout", original_branch, check=False)
-    if checkout_result.returncode != 0:
-        run_git("checkout", "-f", original_branch)
-
-    # Restore stash
-    if has_stash:
-        run_git("stash", "pop", check=False)
-
     print(f"\n\u2705 Announced: {message[:60]}{'...' if len(message) > 60 else ''}")
 
     # Auto-listen after announce to show all announcements
@@ -189,20 +242,19 @@ def cmd_listen(args):
         print("\U0001F4ED No announcements yet")
         return
 
-    # Read events without checkout
+    # Stream events without checkout; the byte pre-filter means only
+    # candidate lines are JSON-decoded
+    announcements = []
     try:
-        result = run_git("show", f"origin/{EVENTS_BRANCH}:.brain/shared-events.jsonl", check=False)
-        if not result.stdout.strip():
-            print("\U0001F4ED No announcements yet")
-            return
-
-        events = [json.loads(line) for line in result.stdout.strip().split("\n") if line.strip()]
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        for line in iter_blob_lines(f"origin/{EVENTS_BRANCH}:.brain/shared-events.jsonl"):
+            if b'"announcement"' in line:
+                event = json.loads(line)
+                if event.get("type") == "announcement":
+                    announcements.append(event)
+    except (OSError, ValueError):
         print("\U0001F4ED No announcements yet")
         return
 
-    announcements = [e for e in events if e.get("type") == "announcement"]
-
     if not announcements:
         print("\U0001F4ED No announcements yet")
         return
@@ -222,17 +274,52 @@ def cmd_listen(args):
 
         marker = "\u2192" if identity and sender_short == identity.get("short_name") else " "
 
-        print(f"{marker} [{ts}] @{sender_id} (from {branch}):")
-        for i in range(0, len(body), 65):
-            print(f"    {body[i:i+65]}")
-        print()
+        entry = f"{marker} [{ts}] @{sender_id} (from {branch}):"
+        wrapped = textwrap.wrap(body, width=65)
+        if wrapped:
+            entry += "\n    " + "\n    ".join(wrapped)
+        print(entry + "\n")
 
     print("=" * 70)
     print("\U0001F4A1 To announce: brain msg announce \"Your message\"")
 
 
+# Commit subjects written by cmd_send/cmd_claim/cmd_release/cmd_complete
+_LOG_SUBJECT_ICONS = (
+    ("msg(", "\U0001F4AC"),
+    ("claim: ", "\U0001F3AF"),
+    ("release: ", "\U0001F513"),
+    ("complete: ", "\u2705"),
+)
+
+
+def _log_from_git(limit: int):
+    """Summarize recent brain commits with one `git log`, skipping the JSONL log."""
+    result = run_git(
+        "log", "-n", str(limit), "--format=%h%x09%aI%x09%s",
+        "-E", "--grep=^(msg\\(|claim: |release: |complete: )",
+        check=False,
+    )
+    entries = result.stdout.splitlines() if result.returncode == 0 else []
+    if not entries:
+        print("\U0001F4ED No events yet")
+        return
+
+    lines = [f"\n\U0001F4DC Last {len(entries)} events (from git log):", "-" * 60]
+    for entry in reversed(entries):
+        short_hash, ts, subject = entry.split("\t", 2)
+        icon = next((i for prefix, i in _LOG_SUBJECT_ICONS if subject.startswith(prefix)), "\u2753")
+        lines.append(f"[{ts[:19]}] {icon} {subject} ({short_hash})")
+    lines.append("-" * 60)
+    print("\n".join(lines))
+
+
 def cmd_log(args):
     """Show recent events from local log."""
+    if getattr(args, 'fast', False):
+        _log_from_git(getattr(args, 'limit', 20) or 20)
+        return
+
     if not EVENTS_FILE.exists():
         print("\U0001F4ED No events yet")
         return
@@ -14,22 +14,34 @@ Commands:
 - gate beforecode/check/dod/verify/run: Quality gates
 """
 
+import hashlib
+import heapq
 import json
+import operator
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from itertools import chain
 from pathlib import Path
 import os
 from typing import Optional
 
 from .core import (
     BRAIN_DIR, ACTIVE_MISSIONS_DIR, COMPLETED_MISSIONS_DIR, ABANDONED_MISSIONS_DIR,
-    MISSION_EVENTS_DIR, EVENTS_BRANCH,
+    MISSION_EVENTS_DIR, MISSION_SNAPSHOTS_DIR, CACHE_DIR, EVENTS_BRANCH,
     now_iso, generate_id,
     ensure_mission_dirs, ensure_brain_dirs, get_identity_name, get_current_branch, git_output,
+    load_identity,
     safe_commit, safe_push, save_json, load_json,
-    run_git,
+    run_git, GitCatFile,
 )
 
 
@@ -116,8 +128,19 @@ def emit_mission_event(
         data=data or {}
     )
 
-    filepath = MISSION_EVENTS_DIR / f"{event.id}.json"
-    save_json(filepath, asdict(event))
+    filepath = MISSION_EVENTS_DIR / f"{event.id}{_EVENT_FILE_SEP}{mission_id}.json"
+    save_json(filepath, asdict(event), ensure_parent=False)
+
+    # Inside emit_events_batch() the commit (and push) happen once at exit
+    batch = _event_batch.get()
+    if batch is not None:
+        batch["events"].append((filepath, event_type.value, mission_id, actor))
+        batch["push"] = batch["push"] or push
+        return filepath
+
+    # Buffered mode: leave the file for `brain mission flush` to commit
+    if os.environ.get("BRAIN_BATCH_EVENTS"):
+        return filepath
 
     # Commit the event
     success, commit_hash, _ = safe_commit(
@@ -131,195 +154,484 @@ def emit_mission_event(
     return filepath
 
 
-def _read_events_from_branch(branch: str, mission_id: Optional[str] = None) -> list[dict]:
-    """Read all mission events from a remote branch."""
-    events = []
+# Pending events of the innermost emit_events_batch(), or None outside one
+_event_batch: ContextVar[Optional[dict]] = ContextVar("_event_batch", default=None)
+
+
+@contextmanager
+def emit_events_batch(push: bool = False):
+    """
+    Commit every event emitted inside the block in one commit, pushing at most once.
 
+        with emit_events_batch(push=True):
+            emit_mission_event(MissionEventType.TASK_CLAIMED, ...)
+            emit_mission_event(MissionEventType.TASK_STARTED, ...)
+
+    Events for one mission and actor keep the usual message format with the
+    types joined, e.g. "event(task_claimed+task_started): <mission> by <actor>".
+    If the block raises, the event files are left uncommitted on disk.
+    Under BRAIN_BATCH_EVENTS nothing is committed either; the files wait for
+    `brain mission flush`, which also takes the push.
+    """
+    batch = {"events": [], "push": push}
+    token = _event_batch.set(batch)
     try:
-        result = run_git("ls-tree", "--name-only", branch, ".brain/missions/events/", check=False)
-        if result.returncode != 0:
-            return []
+        yield
+    finally:
+        _event_batch.reset(token)
 
-        for line in result.stdout.strip().split('\n'):
-            if not line or not line.endswith('.json'):
-                continue
+    # Buffered mode: leave the files for `brain mission flush` to commit
+    if os.environ.get("BRAIN_BATCH_EVENTS"):
+        return
 
-            try:
-                content_result = run_git("show", f"{branch}:{line}", check=False)
-                if content_result.returncode == 0 and content_result.stdout.strip():
-                    event_data = json.loads(content_result.stdout)
-                    # Filter by mission_id if specified
-                    if mission_id is None or event_data.get('mission_id') == mission_id:
-                        event_data['_source_branch'] = branch
-                        events.append(event_data)
-            except (subprocess.CalledProcessError, json.JSONDecodeError):
-                continue
-    except subprocess.CalledProcessError:
-        pass
+    events = batch["events"]
+    if not events:
+        return
+    types = "+".join(event_type for _, event_type, _, _ in events)
+    targets = {(mission_id, actor) for _, _, mission_id, actor in events}
+    if len(targets) == 1:
+        mission_id, actor = targets.pop()
+        message = f"event({types}): {mission_id} by {actor}"
+    else:
+        message = f"events(batch): {len(events)} events\n\n" + "\n".join(
+            f"event({event_type}): {mission_id} by {actor}"
+            for _, event_type, mission_id, actor in events
+        )
+    success, _, _ = safe_commit(message, [str(path) for path, _, _, _ in events])
+
+    if batch["push"] and success:
+        safe_push(get_current_branch())
+
+
+def emit_mission_events(mission_id: str, actor: str, events: list[tuple],
+                        push: bool = False) -> list[Path]:
+    """
+    Emit several `(event_type, data)` events for one mission in a single commit.
+
+    Convenience wrapper around emit_events_batch(); pushes at most once.
+    """
+    with emit_events_batch(push=push):
+        return [emit_mission_event(event_type, mission_id, actor, data)
+                for event_type, data in events]
+
+
+def flush_events(push: bool = False) -> int:
+    """
+    Commit every uncommitted mission event file in one commit.
 
+    Pairs with BRAIN_BATCH_EVENTS, under which emit_mission_event only writes
+    event files. Returns the number of event files committed.
+    """
+    result = run_git("status", "--porcelain=v1", "-z", "--untracked-files=all",
+                     "--", str(MISSION_EVENTS_DIR), check=False)
+    # Entries are "XY <path>\0"; event files are never renamed
+    paths = [entry[3:] for entry in result.stdout.split("\0") if entry[3:].endswith(".json")]
+    if not paths:
+        return 0
+
+    success, _, _ = safe_commit(f"events: batched flush ({len(paths)} events)", paths)
+    if push and success:
+        safe_push(get_current_branch())
+    return len(paths) if success else 0
+
+
+def _batch_check_blobs(objs: list[str]) -> list[Optional[str]]:
+    """
+    Resolve many `rev:path` names to blob shas with one `git cat-file --batch-check`.
+
+    Returns a sha per name, in order, or None where the name is missing or not
+    a blob. Lets callers probe many candidate paths before reading any content.
+    """
+    if not objs:
+        return []
+    result = subprocess.run(
+        ["git", "cat-file", "--batch-check"],
+        input="".join(f"{obj}\n" for obj in objs),
+        capture_output=True, text=True, check=False
+    )
+    # Each line: "<sha> <type> <size>" or "<obj> missing" / "<obj> ambiguous"
+    shas = []
+    for line in result.stdout.splitlines():
+        parts = line.split(" ")
+        shas.append(parts[0] if len(parts) == 3 and parts[1] == "blob" else None)
+    return (shas + [None] * len(objs))[:len(objs)]
+
+
+def _ls_tree_json_blobs(branch: str, *paths: str):
+    """
+    Yield `(blob sha, path)` for the .json files directly under `paths` on a branch.
+
+    One `git ls-tree` call covers every path, and its output is consumed as it
+    streams, so callers can start cat-file reads before the listing finishes.
+    The shas let callers read blobs by id instead of re-resolving `branch:path`.
+    Yields nothing if the branch can't be listed.
+    """
+    proc = subprocess.Popen(
+        ["git", "ls-tree", "-z", branch, *paths],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        pending = b""
+        while chunk := proc.stdout.read1(1 << 16):
+            records = (pending + chunk).split(b"\0")
+            pending = records.pop()
+            for record in records:
+                # "<mode> <type> <sha>\t<path>"
+                meta, _, path = record.decode().partition("\t")
+                parts = meta.split(" ")
+                if len(parts) == 3 and parts[1] == "blob" and path.endswith(".json"):
+                    yield parts[2], path
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+
+# Event files are "<event id>__<mission id>.json" so readers can skip other
+# missions' events by name; older files are plain "<event id>.json".
+_EVENT_FILE_SEP = "__"
+
+
+def _event_file_wanted(filename: str, mission_id: Optional[str], skip_ids: frozenset,
+                       present_ids: Optional[set] = None) -> bool:
+    """
+    Decide from an event file's name alone whether it needs to be read.
+
+    The id of every file that may belong to `mission_id` (read or skipped)
+    is added to `present_ids` when given.
+    """
+    event_id, sep, file_mission_id = filename[:-len(".json")].partition(_EVENT_FILE_SEP)
+    if mission_id and sep and file_mission_id != mission_id:
+        return False
+    if present_ids is not None:
+        present_ids.add(event_id)
+    return event_id not in skip_ids
+
+
+def _read_events_from_branch(branch: str, mission_id: Optional[str] = None,
+                             cat_file: Optional[GitCatFile] = None,
+                             skip_ids: frozenset = frozenset(),
+                             present_ids: Optional[set] = None) -> list[dict]:
+    """
+    Read all mission events from a remote branch.
+
+    Blobs are read through `cat_file` (one shared `git cat-file --batch`
+    process) rather than a `git show` fork per file. Files for other missions
+    or with ids in `skip_ids` are skipped by name without being read.
+    """
+    if cat_file is None:
+        with GitCatFile() as cat_file:
+            return _read_events_from_branch(branch, mission_id, cat_file, skip_ids, present_ids)
+
+    events = []
+
+    for sha, path in _ls_tree_json_blobs(branch, ".brain/missions/events/"):
+        if not _event_file_wanted(path.rsplit('/', 1)[-1], mission_id, skip_ids, present_ids):
+            continue
+
+        try:
+            content = cat_file.read(sha)
+            if content and not content.isspace():
+                event_data = json.loads(content)
+                # Filter by mission_id if specified
+                if mission_id is None or event_data.get('mission_id') == mission_id:
+                    event_data.setdefault('timestamp', '')
+                    event_data['_source_branch'] = branch
+                    events.append(event_data)
+        except ValueError:
+            continue
+
+    events.sort(key=_event_timestamp)
     return events
 
 
-def read_mission_events(mission_id: Optional[str] = None) -> list[dict]:
+def read_mission_events(mission_id: Optional[str] = None,
+                        skip_ids: frozenset = frozenset(),
+                        branches: Optional[list[str]] = None,
+                        present_ids: Optional[set] = None) -> list[dict]:
     """
     Read all mission events from local and all remote branches.
 
     Returns events sorted by timestamp for replay ordering.
     Deduplicates by event ID (same event may exist on multiple branches).
+    Events whose ID is in `skip_ids` (already applied) are not read at all.
+    Callers that already listed the remote branches pass them as `branches`.
+    If `present_ids` is given, the ids of all event files found for the
+    mission, skipped ones included, are added to it.
     """
     events_by_id = {}
 
     # 1. Read local events
     if MISSION_EVENTS_DIR.exists():
         for filepath in MISSION_EVENTS_DIR.glob("*.json"):
+            if not _event_file_wanted(filepath.name, mission_id, skip_ids, present_ids):
+                continue
             data = load_json(filepath)
             if data:
                 if mission_id is None or data.get('mission_id') == mission_id:
+                    data.setdefault('timestamp', '')
                     events_by_id[data['id']] = data
 
     # 2. Read from all remote branches
-    for branch in _get_remote_branches():
-        for event_data in _read_events_from_branch(branch, mission_id):
+    per_branch = _read_across_branches(
+        lambda branch, cat_file: _read_events_from_branch(branch, mission_id, cat_file,
+                                                          skip_ids, present_ids),
+        _get_remote_branches() if branches is None else branches,
+    )
+    sources = [sorted(events_by_id.values(), key=_event_timestamp)]
+    for branch_events in per_branch:
+        unique = []
+        for event_data in branch_events:
             event_id = event_data['id']
             # Deduplicate - same event may be on multiple branches
             if event_id not in events_by_id:
                 events_by_id[event_id] = event_data
+                unique.append(event_data)
+        sources.append(unique)
+
+    # Each source is already in timestamp order; merge them for replay ordering
+    return list(heapq.merge(*sources, key=_event_timestamp))
+
+
+# Replay ordering key; readers default a missing timestamp to '' on load
+_event_timestamp = operator.itemgetter('timestamp')
+
+
+class _ReplayState:
+    """A mission being replayed plus its ID indexes, shared by the event handlers."""
+
+    __slots__ = ("mission", "tasks", "items", "criteria")
+
+    def __init__(self, mission: 'MissionOnHand'):
+        self.mission = mission
+        # Built in reverse so the first entry wins on a duplicate ID, as a scan would
+        self.tasks = {t.id: t for t in reversed(mission.tasks)}
+        self.items = {i.id: i for i in reversed(mission.before_code.items)}
+        self.criteria = {c.id: c for c in reversed(mission.dod.required + mission.dod.optional)}
+
+
+def _on_mission_started(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    state.mission.status = MissionStatus.ACTIVE.value
+
+
+def _on_mission_completed(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    state.mission.status = MissionStatus.COMPLETE.value
+    state.mission.completed_at = timestamp
+
+
+def _on_mission_abandoned(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    state.mission.status = MissionStatus.ABANDONED.value
 
-    # Sort by timestamp for replay ordering
-    events = list(events_by_id.values())
-    return sorted(events, key=lambda e: e.get('timestamp', ''))
+
+def _on_task_claimed(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    task = state.tasks.get(data.get('task_id'))
+    if task:
+        task.claimed_by = actor
+        task.claimed_at = timestamp
+        task.status = TaskStatus.READY.value
+
+
+def _on_task_released(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    task = state.tasks.get(data.get('task_id'))
+    if task:
+        task.claimed_by = None
+        task.claimed_at = None
+        task.status = TaskStatus.PENDING.value
+
+
+def _on_task_started(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    task = state.tasks.get(data.get('task_id'))
+    if task:
+        task.status = TaskStatus.IN_PROGRESS.value
+        task.started_at = timestamp
+        task.assigned_to = actor
+
+
+def _on_task_completed(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    task = state.tasks.get(data.get('task_id'))
+    if task:
+        task.status = TaskStatus.COMPLETE.value
+        task.completed_at = timestamp
+
+
+def _on_checklist_checked(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    checked = data.get('checked', True)
+    item = state.items.get(data.get('item_id'))
+    if item:
+        item.checked = checked
+        if checked:
+            item.checked_by = actor
+            item.checked_at = timestamp
+        else:
+            item.checked_by = None
+            item.checked_at = None
+
+
+def _on_dod_verified(state: _ReplayState, data: dict, actor: str, timestamp: str):
+    evidence = data.get('evidence')
+    criterion = state.criteria.get(data.get('criterion_id'))
+    if criterion:
+        criterion.verified = True
+        criterion.verified_by = actor
+        criterion.verified_at = timestamp
+        if evidence:
+            criterion.evidence = evidence
+
+
+# Event type string -> replay handler; unknown types are ignored
+_EVENT_HANDLERS = {
+    MissionEventType.MISSION_STARTED.value: _on_mission_started,
+    MissionEventType.MISSION_COMPLETED.value: _on_mission_completed,
+    MissionEventType.MISSION_ABANDONED.value: _on_mission_abandoned,
+    MissionEventType.TASK_CLAIMED.value: _on_task_claimed,
+    MissionEventType.TASK_RELEASED.value: _on_task_released,
+    MissionEventType.TASK_STARTED.value: _on_task_started,
+    MissionEventType.TASK_COMPLETED.value: _on_task_completed,
+    MissionEventType.CHECKLIST_CHECKED.value: _on_checklist_checked,
+    MissionEventType.DOD_VERIFIED.value: _on_dod_verified,
+}
 
 
 def apply_events_to_mission(mission: 'MissionOnHand', events: list[dict]) -> 'MissionOnHand':
     """
     Apply a list of events to a mission to compute current state.
 
-    Events must be sorted by timestamp before calling this function.
+    Events must be sorted by timestamp and belong to this mission (as returned
+    by read_mission_events(mission.id)); use apply_events_to_missions_bulk()
+    for an unfiltered stream. Each event is dispatched through _EVENT_HANDLERS,
+    and tasks, checklist items and DoD criteria are looked up by ID.
     """
-    for event in events:
-        if event.get('mission_id') != mission.id:
-            continue
+    state = _ReplayState(mission)
+    timestamp = ''
 
-        event_type = event.get('event_type')
-        data = event.get('data', {})
-        actor = event.get('actor', '')
+    for event in events:
         timestamp = event.get('timestamp', '')
+        handler = _EVENT_HANDLERS.get(event.get('event_type'))
+        if handler:
+            handler(state, event.get('data', {}), event.get('actor', ''), timestamp)
 
-        if event_type == MissionEventType.MISSION_STARTED.value:
-            mission.status = MissionStatus.ACTIVE.value
-
-        elif event_type == MissionEventType.MISSION_COMPLETED.value:
-            mission.status = MissionStatus.COMPLETE.value
-            mission.completed_at = timestamp
-
-        elif event_type == MissionEventType.MISSION_ABANDONED.value:
-            mission.status = MissionStatus.ABANDONED.value
-
-        elif event_type == MissionEventType.TASK_CLAIMED.value:
-            task_id = data.get('task_id')
-            task = next((t for t in mission.tasks if t.id == task_id), None)
-            if task:
-                task.claimed_by = actor
-                task.claimed_at = timestamp
-                task.status = TaskStatus.READY.value
-
-        elif event_type == MissionEventType.TASK_RELEASED.value:
-            task_id = data.get('task_id')
-            task = next((t for t in mission.tasks if t.id == task_id), None)
-            if task:
-                task.claimed_by = None
-                task.claimed_at = None
-                task.status = TaskStatus.PENDING.value
-
-        elif event_type == MissionEventType.TASK_STARTED.value:
-            task_id = data.get('task_id')
-            task = next((t for t in mission.tasks if t.id == task_id), None)
-            if task:
-                task.status = TaskStatus.IN_PROGRESS.value
-                task.started_at = timestamp
-                task.assigned_to = actor
-
-        elif event_type == MissionEventType.TASK_COMPLETED.value:
-            task_id = data.get('task_id')
-            task = next((t for t in mission.tasks if t.id == task_id), None)
-            if task:
-                task.status = TaskStatus.COMPLETE.value
-                task.completed_at = timestamp
-
-        elif event_type == MissionEventType.CHECKLIST_CHECKED.value:
-            item_id = data.get('item_id')
-            checked = data.get('checked', True)
-            item = next((i for i in mission.before_code.items if i.id == item_id), None)
-            if item:
-                item.checked = checked
-                if checked:
-                    item.checked_by = actor
-                    item.checked_at = timestamp
-                else:
-                    item.checked_by = None
-                    item.checked_at = None
-
-        elif event_type == MissionEventType.DOD_VERIFIED.value:
-            criterion_id = data.get('criterion_id')
-            evidence = data.get('evidence')
-            criterion = next(
-                (c for c in mission.dod.required + mission.dod.optional if c.id == criterion_id),
-                None
-            )
-            if criterion:
-                criterion.verified = True
-                criterion.verified_by = actor
-                criterion.verified_at = timestamp
-                if evidence:
-                    criterion.evidence = evidence
-
-        # Update mission's updated_at to latest event
-        if timestamp > (mission.updated_at or ''):
-            mission.updated_at = timestamp
+    # Events are in timestamp order, so the last one applied is the latest.
+    # Timestamps are UTC ISO-8601 strings, which compare correctly as text.
+    if timestamp > (mission.updated_at or ''):
+        mission.updated_at = timestamp
 
     return mission
 
 
+def apply_events_to_missions_bulk(missions: list['MissionOnHand'],
+                                  events: list[dict]) -> dict[str, 'MissionOnHand']:
+    """
+    Apply an unfiltered, timestamp-sorted event stream to several missions.
+
+    Events are bucketed by mission_id in one pass, so each mission replays
+    only its own events. Returns the updated missions keyed by ID.
+    """
+    events_by_mission = defaultdict(list)
+    for event in events:
+        events_by_mission[event.get('mission_id')].append(event)
+    return {m.id: apply_events_to_mission(m, events_by_mission.get(m.id, [])) for m in missions}
+
+
+# Seconds a successful `git fetch --all` is reused across reads in one process
+_FETCH_TTL = 30.0
+
+# git common dir -> (monotonic time, config mtime) of this process's last fetch
+_last_fetch: dict = {}
+
+
+def _fetch_all_if_stale():
+    """
+    Run `git fetch --all` unless this process did so within _FETCH_TTL seconds.
+
+    The record is kept in memory, so the reads of one command share a fetch
+    while every new CLI invocation sees fresh remotes; editing the git
+    config (e.g. adding a remote) forces a fetch.
+    """
+    result = run_git("rev-parse", "--git-common-dir", check=False)
+    if result.returncode != 0:
+        return
+    git_dir = os.path.abspath(result.stdout.strip())
+    try:
+        config_mtime = os.stat(os.path.join(git_dir, "config")).st_mtime_ns
+    except OSError:
+        config_mtime = 0
+
+    last = _last_fetch.get(git_dir)
+    if last and time.monotonic() - last[0] < _FETCH_TTL and last[1] == config_mtime:
+        return
+
+    if run_git("fetch", "--all", check=False).returncode == 0:
+        _last_fetch[git_dir] = (time.monotonic(), config_mtime)
+
+
 def _get_remote_branches() -> list[str]:
     """Get all remote branches for mission aggregation."""
-    run_git("fetch", "--all", check=False)
-    result = run_git("branch", "-r", check=False)
+    _fetch_all_if_stale()
+    result = run_git("for-each-ref", "--format=%(refname)", "refs/remotes/", check=False)
     if result.returncode != 0:
         return []
 
-    branches = []
-    for line in result.stdout.strip().split('\n'):
-        branch = line.strip()
-        if branch and not branch.endswith('/HEAD'):
-            branches.append(branch)
-    return branches
+    # "refs/remotes/origin/main" -> "origin/main"; skip the origin/HEAD symref
+    prefix = len("refs/remotes/")
+    return [ref[prefix:] for ref in result.stdout.splitlines()
+            if ref and not ref.endswith('/HEAD')]
+
+
+_BRANCH_READ_WORKERS = 8
+
+
+def _read_across_branches(reader, branches: list[str]) -> list:
+    """
+    Run `reader(branch, cat_file)` for every branch and return results in order.
+
+    Branches are read on a thread pool (the work is waiting on git pipes);
+    each worker thread keeps its own GitCatFile process for all of its reads.
+    """
+    if len(branches) <= 1:
+        with GitCatFile() as cat_file:
+            return [reader(branch, cat_file) for branch in branches]
+
+    local = threading.local()
+    opened = []
+
+    def read(branch: str):
+        cat_file = getattr(local, "cat_file", None)
+        if cat_file is None:
+            cat_file = local.cat_file = GitCatFile()
+            opened.append(cat_file)
+        return reader(branch, cat_file)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(_BRANCH_READ_WORKERS, len(branches))) as executor:
+            return list(executor.map(read, branches))
+    finally:
+        for cat_file in opened:
+            cat_file.close()
 
 
-def _read_missions_from_branch(branch: str) -> list[dict]:
+def _read_missions_from_branch(branch: str, cat_file: Optional[GitCatFile] = None) -> list[dict]:
     """Read all missions from a remote branch without checkout."""
+    if cat_file is None:
+        with GitCatFile() as cat_file:
+            return _read_missions_from_branch(branch, cat_file)
+
     missions = []
 
-    for subdir in ['active', 'completed', 'abandoned']:
-        try:
-            # List files in directory
-            result = run_git("ls-tree", "--name-only", branch, f".brain/missions/{subdir}/", check=False)
-            if result.returncode != 0:
-                continue
+    # One listing for all three directories, read back in active/completed/abandoned order
+    subdirs = [f".brain/missions/{subdir}/" for subdir in ('active', 'completed', 'abandoned')]
+    entries = list(_ls_tree_json_blobs(branch, *subdirs))
+    entries.sort(key=lambda entry: subdirs.index(entry[1].rsplit('/', 1)[0] + '/'))
 
-            for line in result.stdout.strip().split('\n'):
-                if not line or not line.endswith('.json'):
-                    continue
-
-                # Read file content
-                try:
-                    content_result = run_git("show", f"{branch}:{line}", check=False)
-                    if content_result.returncode == 0 and content_result.stdout.strip():
-                        data = json.loads(content_result.stdout)
-                        data['_source_branch'] = branch
-                        missions.append(data)
-                except (subprocess.CalledProcessError, json.JSONDecodeError):
-                    continue
-        except subprocess.CalledProcessError:
+    for sha, _ in entries:
+        # Read file content by blob id (no path resolution)
+        try:
+            content = cat_file.read(sha)
+            if content and not content.isspace():
+                data = json.loads(content)
+                data['_source_branch'] = branch
+                missions.append(data)
+        except ValueError:
             continue
 
     return missions
@@ -507,42 +819,56 @@ class MissionOnHand:
     completed_at: Optional[str] = None
     deadline: Optional[str] = None
 
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return the first task with `task_id`, or None."""
+        return next((t for t in self.tasks if t.id == task_id), None)
+
+    def get_checklist_item(self, item_id: str) -> Optional[ChecklistItem]:
+        """Return the first beforeCode item with `item_id`, or None."""
+        return next((i for i in self.before_code.items if i.id == item_id), None)
+
+    def get_criterion(self, criterion_id: str) -> Optional[DoDCriterion]:
+        """Return the first required or optional DoD criterion with `criterion_id`, or None."""
+        return next((c for c in chain(self.dod.required, self.dod.optional) if c.id == criterion_id), None)
+
 
 # =============================================================================
 # Serialization
 # =============================================================================
 
 def dataclass_to_dict(obj) -> dict:
-    """Convert dataclass to dict recursively."""
-    if hasattr(obj, '__dataclass_fields__'):
-        return {k: dataclass_to_dict(v) for k, v in asdict(obj).items()}
-    elif isinstance(obj, list):
-        return [dataclass_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: dataclass_to_dict(v) for k, v in obj.items()}
-    elif isinstance(obj, Enum):
-        return obj.value
-    return obj
-
-
-def dict_to_checklist_item(d: dict) -> ChecklistItem:
-    return ChecklistItem(**{k: v for k, v in d.items() if k in ChecklistItem.__dataclass_fields__})
+    """
+    Convert dataclass to dict recursively.
 
+    asdict() already recurses into nested dataclasses, lists and dicts. Status
+    fields hold plain strings, and the str-based enums serialize as their
+    value anyway, so no second pass is needed.
+    """
+    return asdict(obj)
 
-def dict_to_automated_check(d: dict) -> AutomatedCheck:
-    return AutomatedCheck(**{k: v for k, v in d.items() if k in AutomatedCheck.__dataclass_fields__})
 
+def _hydrator(cls):
+    """
+    Build a dict -> `cls` converter that drops keys `cls` does not declare.
 
-def dict_to_dod_criterion(d: dict) -> DoDCriterion:
-    return DoDCriterion(**{k: v for k, v in d.items() if k in DoDCriterion.__dataclass_fields__})
+    Files written by dataclass_to_dict carry exactly the declared fields, so
+    the common case is a single subset check and a direct `cls(**d)` call.
+    """
+    fields = frozenset(cls.__dataclass_fields__)
 
+    def hydrate(d: dict):
+        if fields.issuperset(d):
+            return cls(**d)
+        return cls(**{k: v for k, v in d.items() if k in fields})
 
-def dict_to_task(d: dict) -> Task:
-    return Task(**{k: v for k, v in d.items() if k in Task.__dataclass_fields__})
+    return hydrate
 
 
-def dict_to_strategy(d: dict) -> Strategy:
-    return Strategy(**{k: v for k, v in d.items() if k in Strategy.__dataclass_fields__})
+dict_to_checklist_item = _hydrator(ChecklistItem)
+dict_to_automated_check = _hydrator(AutomatedCheck)
+dict_to_dod_criterion = _hydrator(DoDCriterion)
+dict_to_task = _hydrator(Task)
+dict_to_strategy = _hydrator(Strategy)
 
 
 def dict_to_before_code(d: dict) -> BeforeCodeChecklist:
@@ -592,6 +918,17 @@ def dict_to_mission(d: dict) -> MissionOnHand:
 
 def save_mission(mission: MissionOnHand) -> Path:
     """Save mission to file."""
+    filepath, _ = _save_mission_if_changed(mission)
+    return filepath
+
+
+def _save_mission_if_changed(mission: MissionOnHand) -> tuple[Path, bool]:
+    """
+    Save mission to file unless only updated_at would change.
+
+    Returns (filepath, changed). An unchanged mission is not rewritten and
+    keeps its in-memory updated_at, so callers can skip the commit and push.
+    """
     ensure_mission_dirs()
 
     if mission.status == MissionStatus.COMPLETE.value:
@@ -602,9 +939,14 @@ def save_mission(mission: MissionOnHand) -> Path:
         directory = ACTIVE_MISSIONS_DIR
 
     filepath = directory / f"{mission.id}.json"
-    mission.updated_at = now_iso()
-    save_json(filepath, dataclass_to_dict(mission))
-    return filepath
+    data = dataclass_to_dict(mission)
+    existing = load_json(filepath)
+    if existing is not None and {**existing, 'updated_at': None} == {**data, 'updated_at': None}:
+        return filepath, False
+
+    mission.updated_at = data['updated_at'] = now_iso()
+    save_json(filepath, data)
+    return filepath, True
 
 
 def save_and_commit(mission: MissionOnHand, commit_msg: str, push: bool = False) -> tuple:
@@ -614,9 +956,14 @@ def save_and_commit(mission: MissionOnHand, commit_msg: str, push: bool = False)
     Architecture: Each agent stores missions on their own branch. Cross-branch
     visibility is achieved by aggregating from all remote branches on read.
     This avoids permission issues with shared branches.
+
+    If the mission file is unchanged, nothing is committed or pushed and
+    (filepath, False, "") is returned.
     """
     # Save mission locally
-    filepath = save_mission(mission)
+    filepath, changed = _save_mission_if_changed(mission)
+    if not changed:
+        return filepath, False, ""
 
     # Commit locally
     success, commit_hash, _ = safe_commit(commit_msg, [str(filepath)])
@@ -640,6 +987,8 @@ def load_mission(mission_id: str, apply_events: bool = True) -> Optional[Mission
         apply_events: If True, apply all events to compute current state (default: True)
     """
     mission = None
+    data = None
+    branches = None
 
     # Check local directories first (fast path)
     for directory in [ACTIVE_MISSIONS_DIR, COMPLETED_MISSIONS_DIR, ABANDONED_MISSIONS_DIR]:
@@ -651,28 +1000,96 @@ def load_mission(mission_id: str, apply_events: bool = True) -> Optional[Mission
 
     # Search across all remote branches if not found locally
     if not mission:
-        for branch in _get_remote_branches():
-            for subdir in ['active', 'completed', 'abandoned']:
-                try:
-                    result = run_git("show", f"{branch}:.brain/missions/{subdir}/{mission_id}.json", check=False)
-                    if result.returncode == 0 and result.stdout.strip():
-                        data = json.loads(result.stdout)
-                        mission = dict_to_mission(data)
-                        break
-                except (subprocess.CalledProcessError, json.JSONDecodeError):
-                    continue
-            if mission:
-                break
+        branches = _get_remote_branches()
+        # Probe every branch/subdir candidate in one process, then read only the hits
+        candidates = [f"{branch}:.brain/missions/{subdir}/{mission_id}.json"
+                      for branch in branches
+                      for subdir in ['active', 'completed', 'abandoned']]
+        hits = [sha for sha in _batch_check_blobs(candidates) if sha]
+        if hits:
+            with GitCatFile() as cat_file:
+                for sha in hits:
+                    try:
+                        content = cat_file.read(sha)
+                        if content and not content.isspace():
+                            data = json.loads(content)
+                            mission = dict_to_mission(data)
+                            break
+                    except ValueError:
+                        continue
 
     if not mission:
         return None
 
     # Apply events to compute current state
     if apply_events:
-        events = read_mission_events(mission_id)
-        if events:
-            mission = apply_events_to_mission(mission, events)
+        mission = _apply_events_with_snapshot(mission, data, branches)
+
+    return mission
+
 
+# =============================================================================
+# Mission Snapshots (local materialized view of replayed events)
+# =============================================================================
+#
+# Replaying every event on every load is O(total events). A snapshot stores
+# the replayed state plus the IDs of the events folded into it, so a load
+# only reads and applies events it has not seen. Snapshots live under
+# .brain/cache/ (git-ignored) and are discarded when the base mission file
+# changes or a new event sorts before the snapshot's cursor.
+
+
+def _mission_digest(data: dict) -> str:
+    """Stable digest of a mission file's contents."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _save_snapshot(mission: 'MissionOnHand', base: str, event_ids: list, cursor: str):
+    """Write a mission snapshot, keeping the cache directory out of git."""
+    MISSION_SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    ignore_file = CACHE_DIR / ".gitignore"
+    if not ignore_file.exists():
+        ignore_file.write_text("*\n")
+    save_json(MISSION_SNAPSHOTS_DIR / f"{mission.id}.json", {
+        "base": base,
+        "cursor": cursor,
+        "event_ids": event_ids,
+        "mission": dataclass_to_dict(mission),
+    })
+
+
+def _apply_events_with_snapshot(mission: 'MissionOnHand', data: dict,
+                                branches: Optional[list[str]] = None) -> 'MissionOnHand':
+    """Bring `mission` (loaded from `data`) up to date, reusing a snapshot if valid."""
+    base = _mission_digest(data)
+    if branches is None:
+        branches = _get_remote_branches()
+    snapshot = load_json(MISSION_SNAPSHOTS_DIR / f"{mission.id}.json")
+
+    if snapshot and snapshot.get("base") == base:
+        seen = snapshot.get("event_ids", [])
+        cursor = snapshot.get("cursor", "")
+        present = set()
+        new_events = read_mission_events(mission.id, skip_ids=frozenset(seen),
+                                         branches=branches, present_ids=present)
+        # An applied event that is gone (force-push, deleted branch) forces a full replay
+        retracted = not present.issuperset(seen)
+        if not new_events and not retracted:
+            return dict_to_mission(snapshot["mission"])
+        if not retracted and all(e.get('timestamp', '') > cursor for e in new_events):
+            mission = apply_events_to_mission(dict_to_mission(snapshot["mission"]), new_events)
+            _save_snapshot(mission, base, seen + [e['id'] for e in new_events],
+                           new_events[-1].get('timestamp', ''))
+            return mission
+
+    # No usable snapshot (event retracted or arrived out of order): full replay
+    events = read_mission_events(mission.id, branches=branches)
+    if events:
+        mission = apply_events_to_mission(mission, events)
+    if events or snapshot:
+        # Also rewrites a snapshot whose events were all retracted
+        _save_snapshot(mission, base, [e['id'] for e in events],
+                       events[-1].get('timestamp', '') if events else '')
     return mission
 
 
@@ -681,7 +1098,9 @@ def list_missions(status_filter: Optional[str] = None) -> list:
     List all missions from local directories AND all remote branches.
 
     Architecture: Aggregates missions from all sources, deduplicates by ID,
-    keeping the most recently updated version.
+    keeping the most recently updated version. Only header fields are
+    returned, so mission events are never read or replayed here; use
+    load_mission() when event-derived state is needed.
     """
     missions_by_id = {}
 
@@ -711,8 +1130,10 @@ def list_missions(status_filter: Optional[str] = None) -> list:
                     }
 
     # 2. Read from all remote branches
-    for branch in _get_remote_branches():
-        for mission_data in _read_missions_from_branch(branch):
+    branches = _get_remote_branches()
+    per_branch = _read_across_branches(_read_missions_from_branch, branches)
+    for branch, branch_missions in zip(branches, per_branch):
+        for mission_data in branch_missions:
             mission_id = mission_data['id']
             # Keep if newer or not seen
             existing = missions_by_id.get(mission_id)
@@ -739,15 +1160,26 @@ def list_missions(status_filter: Optional[str] = None) -> list:
 # Automated Check Runner
 # =============================================================================
 
+# Bytes of combined check output kept by run_check
+_CHECK_OUTPUT_CAP = 64 * 1024
+
 def run_check(check: AutomatedCheck) -> tuple[bool, str]:
-    """Run an automated check."""
+    """
+    Run an automated check.
+
+    Output is spooled to a temporary file rather than memory, and only the
+    first _CHECK_OUTPUT_CAP bytes are returned, so a chatty check can't grow
+    the process.
+    """
     try:
-        result = subprocess.run(
-            check.command, shell=True,
-            capture_output=True, text=True, timeout=300
-        )
+        with tempfile.TemporaryFile() as out:
+            result = subprocess.run(
+                check.command, shell=True,
+                stdout=out, stderr=subprocess.STDOUT, timeout=300
+            )
+            out.seek(0)
+            output = out.read(_CHECK_OUTPUT_CAP).decode(errors="replace")
         passed = result.returncode == check.expected_exit_code
-        output = result.stdout + result.stderr
         return passed, output.strip()
     except subprocess.TimeoutExpired:
         return False, "Check timed out"
@@ -759,6 +1191,29 @@ def run_check(check: AutomatedCheck) -> tuple[bool, str]:
 # Commands
 # =============================================================================
 
+# Status icons used by the list/show/gate renderers, keyed by the enum values
+_MISSION_STATUS_EMOJI = {
+    MissionStatus.PLANNING.value: '\U0001F4DD',
+    MissionStatus.ACTIVE.value: '\U0001F525',
+    MissionStatus.BLOCKED.value: '\U0001F534',
+    MissionStatus.PAUSED.value: '\u23F8\uFE0F',
+    MissionStatus.COMPLETE.value: '\u2705',
+    MissionStatus.ABANDONED.value: '\u274C',
+}
+
+_TASK_STATUS_EMOJI = {
+    TaskStatus.PENDING.value: '\u2B1C',
+    TaskStatus.READY.value: '\U0001F7E1',
+    TaskStatus.IN_PROGRESS.value: '\U0001F535',
+    TaskStatus.IN_REVIEW.value: '\U0001F7E3',
+    TaskStatus.BLOCKED.value: '\U0001F534',
+    TaskStatus.COMPLETE.value: '\u2705',
+    TaskStatus.SKIPPED.value: '\u23ED\uFE0F',
+}
+
+_CHECK_RESULT_EMOJI = {"pass": "\u2705", "fail": "\u274C"}
+
+
 def cmd_mission_create(args):
     """Create a new mission."""
     title = " ".join(args.title)
@@ -804,19 +1259,17 @@ def cmd_mission_list(args):
         print("\U0001F4ED No missions found")
         return
 
-    print(f"\n\U0001F4CB Missions ({len(missions)}):")
-    print("\u2500" * 70)
+    # Render into one buffer and write once rather than a print() per line
+    lines = [f"\n\U0001F4CB Missions ({len(missions)}):", "\u2500" * 70]
 
     for m in missions:
-        status_emoji = {
-            'planning': '\U0001F4DD', 'active': '\U0001F525', 'blocked': '\U0001F534',
-            'paused': '\u23F8\uFE0F', 'complete': '\u2705', 'abandoned': '\u274C'
-        }.get(m['status'], '\u2753')
+        status_emoji = _MISSION_STATUS_EMOJI.get(m['status'], '\u2753')
 
-        print(f"{status_emoji} [{m['id']}] {m['title']}")
-        print(f"   Status: {m['status']} | Tasks: {m['tasks']} | By: {m['created_by']}")
+        lines.append(f"{status_emoji} [{m['id']}] {m['title']}")
+        lines.append(f"   Status: {m['status']} | Tasks: {m['tasks']} | By: {m['created_by']}")
 
-    print("\u2500" * 70)
+    lines.append("\u2500" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_mission_show(args):
@@ -848,18 +1301,15 @@ def cmd_mission_show(args):
     print("-" * 40)
     if mission.tasks:
         for task in mission.tasks:
-            emoji = {
-                'pending': '\u2B1C', 'ready': '\U0001F7E1', 'in_progress': '\U0001F535',
-                'in_review': '\U0001F7E3', 'blocked': '\U0001F534', 'complete': '\u2705', 'skipped': '\u23ED\uFE0F'
-            }.get(task.status, '\u2753')
+            emoji = _TASK_STATUS_EMOJI.get(task.status, '\u2753')
             print(f"  {emoji} [{task.id}] {task.title}")
     else:
         print("  (no tasks yet)")
 
-    bc_checked = sum(1 for item in mission.before_code.items if item.checked)
+    bc_checked = sum(item.checked for item in mission.before_code.items)
     print(f"\n\U0001F4DD BEFORE CODE ({bc_checked}/{len(mission.before_code.items)} checked)")
 
-    dod_verified = sum(1 for c in mission.dod.required if c.verified)
+    dod_verified = sum(c.verified for c in mission.dod.required)
     print(f"\u2705 DEFINITION OF DONE ({dod_verified}/{len(mission.dod.required)} verified)")
 
     print("=" * 70)
@@ -914,9 +1364,13 @@ def cmd_mission_complete(args):
 
     new_path = save_mission(mission)
 
-    if old_path.exists() and old_path != new_path:
-        old_path.unlink()
-        run_git("add", str(old_path), check=False)
+    if old_path != new_path:
+        try:
+            old_path.unlink()
+        except FileNotFoundError:
+            pass
+        else:
+            run_git("add", str(old_path), check=False)
 
     success, commit_hash, _ = safe_commit(f"mission(complete): {mission.id}", [str(new_path)])
 
@@ -925,6 +1379,16 @@ def cmd_mission_complete(args):
         print(f"   \U0001F4DD Commit: {commit_hash}")
 
 
+def cmd_mission_flush(args):
+    """Commit mission events buffered under BRAIN_BATCH_EVENTS."""
+    count = flush_events(push=getattr(args, 'push', False))
+
+    if count:
+        print(f"\U0001F4DD Committed {count} buffered event(s)")
+    else:
+        print("\U0001F4ED No buffered events to commit")
+
+
 def cmd_task_add(args):
     """Add a task to a mission."""
     mission = load_mission(args.mission_id)
@@ -960,7 +1424,6 @@ def cmd_task_claim(args):
     Event-Sourced: Emits a TASK_CLAIMED event instead of modifying the mission file.
     This eliminates merge conflicts when multiple agents claim different tasks.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -971,13 +1434,18 @@ def cmd_task_claim(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    task = next((t for t in mission.tasks if t.id == args.task_id), None)
+    task = mission.get_task(args.task_id)
     if not task:
         print(f"\u274C Task not found: {args.task_id}")
         sys.exit(1)
 
+    # Re-claiming our own task would only replay the same claim
+    if task.claimed_by == identity["full_id"]:
+        print(f"\u2139\uFE0F  Already claimed by you: {task.title} (no-op)")
+        return
+
     # Check if already claimed by another agent
-    if task.claimed_by and task.claimed_by != identity["full_id"]:
+    if task.claimed_by:
         if getattr(args, 'force', False):
             print(f"\u26A0\uFE0F  Force-claiming from {task.claimed_by} (stale claim override)")
         else:
@@ -985,7 +1453,7 @@ def cmd_task_claim(args):
             print("   Use --force to override a stale claim")
             sys.exit(1)
 
-    old_claimer = task.claimed_by if task.claimed_by != identity["full_id"] else None
+    old_claimer = task.claimed_by
 
     # Emit event instead of modifying mission file
     push = getattr(args, 'push', False)
@@ -1013,7 +1481,6 @@ def cmd_task_release(args):
 
     Event-Sourced: Emits a TASK_RELEASED event instead of modifying the mission file.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -1024,7 +1491,7 @@ def cmd_task_release(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    task = next((t for t in mission.tasks if t.id == args.task_id), None)
+    task = mission.get_task(args.task_id)
     if not task:
         print(f"\u274C Task not found: {args.task_id}")
         sys.exit(1)
@@ -1062,7 +1529,6 @@ def cmd_task_start(args):
 
     Event-Sourced: Emits TASK_CLAIMED (if needed) and TASK_STARTED events.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -1074,7 +1540,7 @@ def cmd_task_start(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    task = next((t for t in mission.tasks if t.id == args.task_id), None)
+    task = mission.get_task(args.task_id)
 
     if not task:
         print(f"\u274C Task not found: {args.task_id}")
@@ -1082,28 +1548,23 @@ def cmd_task_start(args):
 
     push = getattr(args, 'push', False)
 
-    # Auto-claim if not claimed
-    if not task.claimed_by:
-        emit_mission_event(
-            event_type=MissionEventType.TASK_CLAIMED,
-            mission_id=args.mission_id,
-            actor=identity["full_id"],
-            data={"task_id": args.task_id, "task_title": task.title, "auto_claim": True},
-            push=False  # Don't push yet, we'll push with start event
-        )
-        print(f"   Auto-claimed task")
-    elif task.claimed_by != identity["full_id"]:
+    if task.claimed_by and task.claimed_by != identity["full_id"]:
         print(f"\u274C Task claimed by {task.claimed_by}. Claim it first or ask them to release.")
         sys.exit(1)
 
-    # Emit start event
-    emit_mission_event(
-        event_type=MissionEventType.TASK_STARTED,
-        mission_id=args.mission_id,
-        actor=identity["full_id"],
-        data={"task_id": args.task_id, "task_title": task.title},
-        push=push
-    )
+    events = []
+
+    # Auto-claim if not claimed
+    if not task.claimed_by:
+        events.append((MissionEventType.TASK_CLAIMED,
+                       {"task_id": args.task_id, "task_title": task.title, "auto_claim": True}))
+
+    events.append((MissionEventType.TASK_STARTED, {"task_id": args.task_id, "task_title": task.title}))
+
+    # Claim (if needed) and start land in one commit and one push
+    emit_mission_events(args.mission_id, identity["full_id"], events, push=push)
+    if len(events) > 1:
+        print(f"   Auto-claimed task")
 
     print(f"\U0001F535 Task started: {task.title}")
     print("   \U0001F4DD Event emitted (conflict-free)")
@@ -1115,7 +1576,6 @@ def cmd_task_complete(args):
 
     Event-Sourced: Emits a TASK_COMPLETED event instead of modifying the mission file.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -1127,7 +1587,7 @@ def cmd_task_complete(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    task = next((t for t in mission.tasks if t.id == args.task_id), None)
+    task = mission.get_task(args.task_id)
 
     if not task:
         print(f"\u274C Task not found: {args.task_id}")
@@ -1165,7 +1625,7 @@ def cmd_gate_beforecode(args):
         if item.checked and item.checked_by:
             print(f"      \u2514\u2500 Checked by {item.checked_by}")
 
-    checked_count = sum(1 for item in mission.before_code.items if item.checked)
+    checked_count = sum(item.checked for item in mission.before_code.items)
     print("-" * 60)
     print(f"Progress: {checked_count}/{len(mission.before_code.items)} checked")
 
@@ -1176,7 +1636,6 @@ def cmd_gate_check(args):
 
     Event-Sourced: Emits a CHECKLIST_CHECKED event instead of modifying the mission file.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -1188,7 +1647,7 @@ def cmd_gate_check(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    item = next((i for i in mission.before_code.items if i.id == args.item_id), None)
+    item = mission.get_checklist_item(args.item_id)
 
     if not item:
         print(f"\u274C Item not found: {args.item_id}")
@@ -1243,7 +1702,7 @@ def cmd_gate_dod(args):
     if mission.dod.automated:
         print("\n\U0001F916 AUTOMATED CHECKS:")
         for check in mission.dod.automated:
-            result_emoji = {"\u2705": "pass", "\u274C": "fail"}.get(check.last_result, "\u2B1C")
+            result_emoji = _CHECK_RESULT_EMOJI.get(check.last_result, "\u2B1C")
             print(f"  {result_emoji} [{check.id}] {check.description}")
 
     print("=" * 60)
@@ -1255,7 +1714,6 @@ def cmd_gate_verify(args):
 
     Event-Sourced: Emits a DOD_VERIFIED event instead of modifying the mission file.
     """
-    from .core import load_identity
     identity = load_identity()
     if not identity:
         print("\u274C No identity. Run: brain init --name <name>")
@@ -1267,11 +1725,7 @@ def cmd_gate_verify(args):
         print(f"\u274C Mission not found: {args.mission_id}")
         sys.exit(1)
 
-    criterion = None
-    for c in mission.dod.required + mission.dod.optional:
-        if c.id == args.criterion_id:
-            criterion = c
-            break
+    criterion = mission.get_criterion(args.criterion_id)
 
     if not criterion:
         print(f"\u274C Criterion not found: {args.criterion_id}")
@@ -1309,13 +1763,10 @@ def cmd_gate_run(args):
     print("-" * 60)
 
     all_passed = True
+    checks = mission.dod.automated
+    jobs = max(1, getattr(args, "jobs", 1) or 1)
 
-    for check in mission.dod.automated:
-        print(f"\n\u25B6\uFE0F  {check.description}")
-        print(f"   Command: {check.command}")
-
-        passed, output = run_check(check)
-
+    def report(check, passed, output):
         check.last_run = now_iso()
         check.last_result = "pass" if passed else "fail"
 
@@ -1325,7 +1776,25 @@ def cmd_gate_run(args):
             print("   \u274C FAILED")
             if output:
                 print(f"   Output: {output[:200]}")
-            all_passed = False
+
+    if jobs == 1:
+        # Default: one at a time, announcing each check before it runs
+        for check in checks:
+            print(f"\n\u25B6\uFE0F  {check.description}")
+            print(f"   Command: {check.command}", flush=True)
+            passed, output = run_check(check)
+            report(check, passed, output)
+            all_passed = all_passed and passed
+    else:
+        # Opt-in: checks share the working directory, so only independent
+        # ones should run concurrently; results are reported in order
+        with ThreadPoolExecutor(max_workers=min(jobs, max(1, len(checks)))) as pool:
+            results = list(pool.map(run_check, checks))
+        for check, (passed, output) in zip(checks, results):
+            print(f"\n\u25B6\uFE0F  {check.description}")
+            print(f"   Command: {check.command}")
+            report(check, passed, output)
+            all_passed = all_passed and passed
 
     _, success, commit_hash = save_and_commit(mission, "mission(dod): run automated checks")
 
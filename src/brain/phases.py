@@ -20,9 +20,11 @@ Commands:
 Storage: .brain/claims/ (git-tracked, multi-agent aware)
 """
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
 from .core import (
@@ -30,7 +32,7 @@ from .core import (
     now_iso, ensure_brain_dirs,
     run_git, git_output, get_current_branch, get_head_commit,
     require_identity,
-    append_event, save_message, save_json,
+    append_event, save_message, save_json, load_json,
     safe_commit, safe_push,
 )
 
@@ -58,16 +60,16 @@ def cmd_claim(args):
     ensure_brain_dirs()
     CLAIMS_DIR.mkdir(parents=True, exist_ok=True)
     claim_file = CLAIMS_DIR / f"phase-{phase}-claim.json"
-    save_json(claim_file, event)
+    save_json(claim_file, event, ensure_parent=False)
 
     # Append to local events
     append_event(event)
 
     # Save message
-    save_message(identity, "claim", {"phase": phase})
+    save_message(identity, "claim", {"phase": phase}, event["head_at_claim"])
 
-    # Git commit
-    run_git("add", "-A")
+    # Git commit (stage only .brain/ so the worktree outside it isn't scanned)
+    run_git("add", "-A", "--", str(BRAIN_DIR))
     success, commit_hash, _ = safe_commit(f"claim: Phase {phase} by @{identity['short_name']}")
 
     if not success:
@@ -104,7 +106,7 @@ def cmd_release(args):
     append_event(event)
     save_message(identity, "release", {"phase": phase, "reason": reason})
 
-    run_git("add", "-A")
+    run_git("add", "-A", "--", str(BRAIN_DIR))
     success, commit_hash, _ = safe_commit(f"release: Phase {phase} by @{identity['short_name']} ({reason})")
 
     if not success:
@@ -142,9 +144,9 @@ def cmd_complete(args):
     save_json(complete_file, event)
 
     append_event(event)
-    save_message(identity, "complete", {"phase": phase, "pr": pr})
+    save_message(identity, "complete", {"phase": phase, "pr": pr}, event["merge_commit"])
 
-    run_git("add", "-A")
+    run_git("add", "-A", "--", str(BRAIN_DIR))
     success, commit_hash, _ = safe_commit(f"complete: Phase {phase} (PR {pr}) by @{identity['short_name']}")
 
     if not success:
@@ -157,6 +159,18 @@ def cmd_complete(args):
         safe_push(get_current_branch())
 
 
+# Claims are ordered by phase number; the key is computed on load
+_by_sort_key = itemgetter("_sort_key")
+
+
+def _phase_sort_key(phase) -> tuple:
+    """Numeric phases in numeric order (2 before 10); anything else after them."""
+    try:
+        return (0, int(phase), "")
+    except (TypeError, ValueError):
+        return (1, 0, str(phase))
+
+
 def cmd_phases(args):
     """Show all phases from .brain/claims/."""
     claims_dir = BRAIN_DIR / "claims"
@@ -164,7 +178,13 @@ def cmd_phases(args):
     print("\n\U0001F9E0 Phase Claims:")
     print("-" * 70)
 
-    if not claims_dir.exists():
+    # DirEntry.is_file() uses the type from the directory read, so
+    # filtering the listing needs no per-entry stat
+    try:
+        with os.scandir(claims_dir) as entries:
+            claim_files = sorted(entry.path for entry in entries
+                                 if entry.name.endswith(".json") and entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
         print("   (no claims directory)")
         print("-" * 70)
         return
@@ -172,54 +192,88 @@ def cmd_phases(args):
     active_claims = []
     completed = []
 
-    for claim_file in sorted(claims_dir.glob("*.json")):
-        try:
-            with open(claim_file) as f:
-                data = json.load(f)
-
-            phase = data.get("phase", "?")
-            developer = data.get("developer", "?")
-            developer_id = data.get("developer_id", "")
-            claim_type = data.get("type", "?")
-
-            if claim_type == "claim":
-                branch = data.get("branch", "-")
-                ts = data.get("ts", "-")
-                if ts != "-":
-                    ts = ts[:10]
-                active_claims.append({
-                    "phase": phase,
-                    "developer": developer,
-                    "developer_id": developer_id,
-                    "branch": branch,
-                    "ts": ts
-                })
-            elif claim_type == "complete":
-                pr = data.get("pr", "-")
-                completed.append({
-                    "phase": phase,
-                    "developer": developer,
-                    "pr": pr
-                })
-        except (json.JSONDecodeError, KeyError):
+    for claim_file in claim_files:
+        # Unreadable or malformed claim files are skipped
+        data = load_json(claim_file)
+        if not isinstance(data, dict):
             continue
 
+        phase = data.get("phase", "?")
+        developer = data.get("developer", "?")
+        developer_id = data.get("developer_id", "")
+        claim_type = data.get("type", "?")
+
+        if claim_type == "claim":
+            branch = data.get("branch", "-")
+            ts = data.get("ts", "-")
+            if ts != "-":
+                ts = ts[:10]
+            active_claims.append({
+                "_sort_key": _phase_sort_key(phase),
+                "phase": phase,
+                "developer": developer,
+                "developer_id": developer_id,
+                "branch": branch,
+                "ts": ts
+            })
+        elif claim_type == "complete":
+            pr = data.get("pr", "-")
+            completed.append({
+                "_sort_key": _phase_sort_key(phase),
+                "phase": phase,
+                "developer": developer,
+                "pr": pr
+            })
+
+    # Render into one buffer and write once rather than a print() per line
+    lines = []
     if active_claims:
-        print("  Active Claims:")
-        for claim in sorted(active_claims, key=lambda x: str(x["phase"])):
+        lines.append("  Active Claims:")
+        for claim in sorted(active_claims, key=_by_sort_key):
             dev_display = claim["developer_id"] or claim["developer"]
-            print(f"    \U0001F7E1 Phase {claim['phase']}: {dev_display}")
-            print(f"       Branch: {claim['branch']}")
-            print(f"       Started: {claim['ts']}")
+            lines.append(f"    \U0001F7E1 Phase {claim['phase']}: {dev_display}")
+            lines.append(f"       Branch: {claim['branch']}")
+            lines.append(f"       Started: {claim['ts']}")
     else:
-        print("   (no active claims)")
+        lines.append("   (no active claims)")
 
     if completed:
-        print("\n  Completed:")
-        for comp in sorted(completed, key=lambda x: str(x["phase"])):
-            print(f"    \u2705 Phase {comp['phase']}: {comp['developer']} (PR: {comp['pr']})")
+        lines.append("\n  Completed:")
+        for comp in sorted(completed, key=_by_sort_key):
+            lines.append(f"    \u2705 Phase {comp['phase']}: {comp['developer']} (PR: {comp['pr']})")
 
-    print("-" * 70)
+    lines.append("-" * 70)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Dev branches whose recent activity is read concurrently by brain sync
+_SYNC_WORKERS = 8
+
+
+def _branch_protocol_commits(branch: str, limit: int) -> list:
+    """Return up to `limit` recent protocol commit lines ("<hash> <subject>") on one branch."""
+    result = run_git(
+        "log", branch, "--oneline", f"-{limit}",
+        "-E", "--grep=msg\\(|claim:|complete:",
+        check=False
+    )
+    return result.stdout.splitlines()
+
+
+def _recent_protocol_commits(branches: list, per_branch: int) -> list:
+    """
+    Return up to `per_branch` recent protocol commits per dev branch as (dev_name, line).
+
+    Each branch gets its own bounded `git log`, so a commit shared by
+    several branches is listed under each of them and a busy branch cannot
+    crowd out quieter ones; the logs run in a small thread pool.
+    """
+    if not branches:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_SYNC_WORKERS, len(branches))) as pool:
+        logs = pool.map(lambda branch: _branch_protocol_commits(branch, per_branch), branches)
+        return [(branch.replace("origin/dev/", "").split("/")[0], line)
+                for branch, lines in zip(branches, logs) for line in lines]
 
 
 def cmd_sync(args):
@@ -241,20 +295,8 @@ def cmd_sync(args):
     print("\n\U0001F4E8 Recent messages:")
     print("-" * 60)
 
-    for branch in dev_branches[:10]:
-        dev_name = branch.replace("origin/dev/", "").split("/")[0]
-
-        try:
-            result = run_git(
-                "log", branch, "--oneline", "-5",
-                "--grep=msg(", "--grep=claim:", "--grep=complete:",
-                check=False
-            )
-            if result.stdout.strip():
-                for line in result.stdout.strip().split("\n")[:3]:
-                    print(f"  [{dev_name}] {line}")
-        except subprocess.CalledProcessError:
-            pass
+    for dev_name, line in _recent_protocol_commits(dev_branches[:10], per_branch=3):
+        print(f"  [{dev_name}] {line}")
 
     print("-" * 60)
     print(f"\n\u2705 Synced. You are: @{identity['short_name']}")
@@ -267,19 +309,20 @@ def cmd_receipt(args):
     run_git("fetch", "--all", check=False)
     current_head = get_head_commit()
 
+    now = datetime.now(timezone.utc)
     receipt = {
         "type": "read-receipt",
         "from": identity["short_name"],
         "from_id": identity["full_id"],
         "up_to_commit": current_head,
-        "ts": now_iso()
+        "ts": now.isoformat()
     }
 
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    ts = now.strftime("%Y%m%d-%H%M%S")
     receipt_file = RECEIPTS_DIR / identity["short_name"] / f"{ts}.json"
     receipt_file.parent.mkdir(parents=True, exist_ok=True)
 
-    save_json(receipt_file, receipt)
+    save_json(receipt_file, receipt, ensure_parent=False)
     append_event(receipt)
 
     success, commit_hash, _ = safe_commit(
@@ -22,42 +22,33 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 
-@pytest.fixture
-def temp_repo() -> Generator[Path, None, None]:
+@pytest.fixture(scope="session")
+def _repo_template(tmp_path_factory) -> Path:
     """
-    Create a temporary git repository for testing.
-    Yields the path to the repo root.
-    Cleans up after test.
+    Build the pristine test repository once per session.
+    temp_repo copies it, so each test skips the git init/config/commit spawns.
+    Each test still gets its own copy: commands commit, branch and push, so a
+    shared module-scoped repo could not be reset by clearing .brain/ alone.
     """
-    original_cwd = os.getcwd()
-    temp_dir = tempfile.mkdtemp(prefix="brain_test_")
-    temp_path = Path(temp_dir)
+    template = tmp_path_factory.mktemp("brain_template")
 
-    try:
-        os.chdir(temp_path)
+    def git(*args):
+        subprocess.run(["git", *args], check=True, capture_output=True, cwd=template)
 
-        # Initialize git repo
-        subprocess.run(["git", "init"], check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            check=True, capture_output=True
-        )
-        # Disable commit signing for tests
-        subprocess.run(
-            ["git", "config", "commit.gpgsign", "false"],
-            check=True, capture_output=True
-        )
-
-        # Create minimal package.json (required by brain)
-        (temp_path / "package.json").write_text('{"name": "test"}')
-
-        # Create docs dir with PHASE-CLAIMS.md
-        (temp_path / "docs").mkdir()
-        (temp_path / "docs" / "PHASE-CLAIMS.md").write_text("""# Phase Claims Registry
+    # Initialize git repo; the empty template skips the sample hooks, which
+    # would otherwise be copied into every temp_repo
+    git("init", "--template=")
+    git("config", "user.email", "test@test.com")
+    git("config", "user.name", "Test User")
+    # Disable commit signing for tests
+    git("config", "commit.gpgsign", "false")
+
+    # Create minimal package.json (required by brain)
+    (template / "package.json").write_text('{"name": "test"}')
+
+    # Create docs dir with PHASE-CLAIMS.md
+    (template / "docs").mkdir()
+    (template / "docs" / "PHASE-CLAIMS.md").write_text("""# Phase Claims Registry
 
 | Phase | Description | Status | Claimed By | Branch | Started | PR |
 |-------|-------------|--------|------------|--------|---------|-----|
@@ -68,12 +59,27 @@ def temp_repo() -> Generator[Path, None, None]:
 | 15 | Config | BLOCKED | - | - | - | - |
 """)
 
-        # Initial commit
-        subprocess.run(["git", "add", "-A"], check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            check=True, capture_output=True
-        )
+    # Initial commit
+    git("add", "-A")
+    git("commit", "-m", "Initial commit")
+
+    return template
+
+
+@pytest.fixture
+def temp_repo(_repo_template: Path) -> Generator[Path, None, None]:
+    """
+    Create a temporary git repository for testing.
+    Yields the path to the repo root.
+    Cleans up after test.
+    """
+    original_cwd = os.getcwd()
+    temp_dir = tempfile.mkdtemp(prefix="brain_test_")
+    temp_path = Path(temp_dir)
+
+    try:
+        shutil.copytree(_repo_template, temp_path, symlinks=True, dirs_exist_ok=True)
+        os.chdir(temp_path)
 
         yield temp_path
 
@@ -89,18 +95,10 @@ def temp_repo() -> Generator[Path, None, None]:
 @pytest.fixture
 def brain_module(temp_repo: Path):
     """
-    Import brain.py module dynamically for testing.
+    Import the legacy brain.py module (brain.brain) for testing.
     DEPRECATED: Use brain_core, brain_identity, etc. fixtures instead.
     """
-    import importlib.util
-
-    # Get path to brain.py (in src/brain/)
-    brain_path = Path(__file__).parent.parent / "src" / "brain" / "brain.py"
-
-    spec = importlib.util.spec_from_file_location("brain_legacy", brain_path)
-    brain = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(brain)
-
+    from brain import brain
     return brain
 
 
@@ -183,21 +181,26 @@ def identity_file(temp_repo: Path) -> Path:
     return brain_dir / "self.json"
 
 
+# Sample identity data (v3 format with color/emotion), serialized once
+SAMPLE_IDENTITY = {
+    "uuid": "12345678-1234-1234-1234-123456789abc",
+    "short_name": "testuser",
+    "color": "emerald",
+    "emotion": "swift",
+    "full_id": "testuser-emerald-swift",
+    "emoji": "\U0001F916",
+    "created_at": "2025-12-03T10:00:00+00:00",
+    "version": 3,
+    "has_keys": False,
+    "public_key_fingerprint": None
+}
+_SAMPLE_IDENTITY_JSON = json.dumps(SAMPLE_IDENTITY).encode()
+
+
 @pytest.fixture
 def sample_identity() -> dict:
-    """Sample identity data (v3 format with color/emotion)."""
-    return {
-        "uuid": "12345678-1234-1234-1234-123456789abc",
-        "short_name": "testuser",
-        "color": "emerald",
-        "emotion": "swift",
-        "full_id": "testuser-emerald-swift",
-        "emoji": "\U0001F916",
-        "created_at": "2025-12-03T10:00:00+00:00",
-        "version": 3,
-        "has_keys": False,
-        "public_key_fingerprint": None
-    }
+    """Sample identity data (v3 format with color/emotion); a fresh copy per test."""
+    return dict(SAMPLE_IDENTITY)
 
 
 @pytest.fixture
@@ -216,9 +219,11 @@ def sample_identity_v1() -> dict:
 @pytest.fixture
 def initialized_identity(identity_file: Path, sample_identity: dict) -> dict:
     """Create an initialized identity and return it."""
-    with open(identity_file, "w") as f:
-        json.dump(sample_identity, f)
-    os.chmod(identity_file, 0o600)
+    # Each test's repo is fresh, so the file is always created here and
+    # gets its 600 mode from the open call without a separate chmod
+    fd = os.open(identity_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_SAMPLE_IDENTITY_JSON)
     return sample_identity
 
 
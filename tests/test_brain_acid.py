@@ -10,70 +10,156 @@ Tests Atomicity, Consistency, Isolation, and Durability for:
 DRY: Shared fixtures and helpers for all command types.
 """
 
+import hashlib
+import io
 import json
+import os
+import re
 import subprocess
 import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Callable
 
 import pytest
 
+from brain.cli import main as cli_main
+
 
 # =============================================================================
 # DRY Helpers
 # =============================================================================
 
-def run_brain_cmd(brain_cli_path: Path, temp_repo: Path, *args) -> subprocess.CompletedProcess:
-    """Run a brain CLI command and return the result."""
-    return subprocess.run(
-        [sys.executable, str(brain_cli_path)] + list(args),
-        capture_output=True,
-        text=True,
-        cwd=temp_repo
-    )
-
-
-def get_brain_files(brain_dir: Path) -> set:
-    """Get all files in .brain directory."""
-    if not brain_dir.exists():
-        return set()
-    return {f for f in brain_dir.rglob("*") if f.is_file()}
-
-
-def get_file_contents(brain_dir: Path) -> dict:
-    """Get contents of all JSON files in .brain directory."""
-    contents = {}
-    if not brain_dir.exists():
-        return contents
-    for f in brain_dir.rglob("*.json"):
+def run_brain_cmd(brain_cli_path: Path, temp_repo: Path, *args,
+                  isolated: bool = False) -> subprocess.CompletedProcess:
+    """
+    Run a brain CLI command and return the result.
+
+    Commands run in-process through brain.cli.main (no interpreter start-up
+    per call); pass isolated=True to spawn brain_cli.py in a fresh process.
+    """
+    if isolated:
+        return subprocess.run(
+            [sys.executable, str(brain_cli_path)] + list(args),
+            capture_output=True,
+            text=True,
+            cwd=temp_repo
+        )
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    original_cwd = os.getcwd()
+    returncode = 0
+    os.chdir(temp_repo)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                cli_main(list(args))
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                # Mirror an uncaught exception in a real process
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        os.chdir(original_cwd)
+
+    return subprocess.CompletedProcess(list(args), returncode, stdout.getvalue(), stderr.getvalue())
+
+
+def seed_missions(brain_cli_path: Path, temp_repo: Path, *titles: str) -> list:
+    """Create one mission per title via the in-process CLI; return their data in title order."""
+    active_dir = temp_repo / ".brain" / "missions" / "active"
+    missions = []
+    for title in titles:
+        result = run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", title)
+        assert result.returncode == 0, f"mission create failed: {result.stderr}"
+        mission_id = re.search(r"mission-[0-9a-f]+", result.stdout).group(0)
+        missions.append(read_json(active_dir / f"{mission_id}.json"))
+    return missions
+
+
+def _walk_brain(brain_dir: Path):
+    """Yield the path of every file under brain_dir via os.scandir (no per-entry stat)."""
+    stack = [str(brain_dir)]
+    while stack:
         try:
-            contents[str(f.relative_to(brain_dir))] = f.read_text()
-        except Exception:
-            pass
-    return contents
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def get_brain_files(brain_dir: Path) -> frozenset:
+    """Get all file paths in .brain directory."""
+    return frozenset(_walk_brain(brain_dir))
+
+
+def brain_signature(brain_dir: Path) -> bytes:
+    """
+    Digest of every file's (relative path, inode, size, mtime) under .brain.
+
+    Catches files added, removed or rewritten without reading any content;
+    the inode covers same-size rewrites within one mtime tick, since
+    save_json replaces files rather than writing in place.
+    """
+    stats = []
+    for path in _walk_brain(brain_dir):
+        st = os.stat(path)
+        stats.append((os.path.relpath(path, brain_dir), st.st_ino, st.st_size, st.st_mtime_ns))
+    h = hashlib.blake2b(digest_size=16)
+    for rel, ino, size, mtime_ns in sorted(stats):
+        h.update(f"{rel}\0{ino}\0{size}\0{mtime_ns}\0".encode())
+    return h.digest()
+
+
+def read_json(path: Path):
+    """Parse a JSON file from its raw bytes (json.loads decodes UTF-8 itself)."""
+    with open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 def count_events(brain_dir: Path) -> int:
-    """Count events in events.jsonl."""
-    events_file = brain_dir / "events.jsonl"
-    if not events_file.exists():
+    """Count non-empty lines in events.jsonl, streaming the raw bytes."""
+    try:
+        with open(brain_dir / "events.jsonl", "rb") as f:
+            return sum(1 for line in f if line.strip())
+    except FileNotFoundError:
         return 0
-    return len([l for l in events_file.read_text().strip().split('\n') if l])
+
+
+def list_mission_files(brain_dir: Path) -> list:
+    """Paths of the active mission files (os.scandir with a name check; [] when absent)."""
+    try:
+        with os.scandir(brain_dir / "missions" / "active") as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.startswith("mission-") and entry.name.endswith(".json")]
+    except FileNotFoundError:
+        return []
 
 
 def count_mission_events(brain_dir: Path) -> int:
     """Count mission event files."""
-    events_dir = brain_dir / "missions" / "events"
-    if not events_dir.exists():
+    try:
+        with os.scandir(brain_dir / "missions" / "events") as entries:
+            return sum(1 for entry in entries
+                       if entry.name.startswith("evt-") and entry.name.endswith(".json"))
+    except FileNotFoundError:
         return 0
-    return len(list(events_dir.glob("evt-*.json")))
 
 
-def has_mission_state_changed(brain_dir: Path, before_files: set, before_contents: dict) -> bool:
-    """Check if mission state has changed (files added or content modified)."""
-    after_files = get_brain_files(brain_dir)
-    after_contents = get_file_contents(brain_dir)
-    return after_files != before_files or after_contents != before_contents
+def has_mission_state_changed(brain_dir: Path, before_signature: bytes) -> bool:
+    """Check if mission state has changed (files added, removed or modified)."""
+    return brain_signature(brain_dir) != before_signature
 
 
 # =============================================================================
@@ -97,9 +183,8 @@ class ACIDTestBase:
     def assert_valid_json(path: Path) -> dict:
         """Assert file contains valid JSON and return it."""
         assert path.exists(), f"File should exist: {path}"
-        content = path.read_text()
         try:
-            return json.loads(content)
+            return read_json(path)
         except json.JSONDecodeError as e:
             pytest.fail(f"Invalid JSON in {path}: {e}")
 
@@ -114,6 +199,29 @@ class ACIDTestBase:
         assert result.returncode != 0, f"Command should have failed. {msg}"
 
 
+@pytest.fixture
+def claimed_phase(temp_repo, brain_cli_path, initialized_identity) -> dict:
+    """Claim phase 17 via the CLI; return the result, claim file and event counts around it."""
+    brain_dir = temp_repo / ".brain"
+    events_before = count_events(brain_dir)
+    result = run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "17")
+    return {
+        "phase": "17",
+        "result": result,
+        "file": brain_dir / "claims" / "phase-17-claim.json",
+        "events_before": events_before,
+        "events_after": count_events(brain_dir),
+    }
+
+
+@pytest.fixture
+def mission_with_id(temp_repo, brain_cli_path, initialized_identity) -> dict:
+    """Create one mission via the CLI; return its id, file path and initial data."""
+    (data,) = seed_missions(brain_cli_path, temp_repo, "Task Test Mission")
+    mission_file = temp_repo / ".brain" / "missions" / "active" / f"{data['id']}.json"
+    return {"id": data["id"], "file": mission_file, "data": data}
+
+
 # =============================================================================
 # Phase Command ACID Tests
 # =============================================================================
@@ -121,34 +229,24 @@ class ACIDTestBase:
 class TestPhaseACIDAtomicity(ACIDTestBase):
     """ACID Atomicity: Phase operations complete entirely or not at all."""
 
-    def test_phase_claim_creates_all_artifacts(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_phase_claim_creates_all_artifacts(self, claimed_phase):
         """Phase claim should atomically create claim file and event."""
-        brain_dir = temp_repo / ".brain"
-        events_before = count_events(brain_dir)
-
-        result = run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "17")
-        self.assert_command_success(result)
+        self.assert_command_success(claimed_phase["result"])
 
         # Both artifacts created atomically
-        claim_file = brain_dir / "claims" / "phase-17-claim.json"
-        self.assert_file_exists(claim_file, "Claim file should be created")
-
-        events_after = count_events(brain_dir)
-        assert events_after > events_before, "Event should be logged"
+        self.assert_file_exists(claimed_phase["file"], "Claim file should be created")
+        assert claimed_phase["events_after"] > claimed_phase["events_before"], "Event should be logged"
 
-    def test_phase_release_removes_claim_atomically(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_phase_release_removes_claim_atomically(self, temp_repo, brain_cli_path, claimed_phase):
         """Phase release should atomically remove claim and log event."""
         brain_dir = temp_repo / ".brain"
-
-        # First claim
-        run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "18")
-        claim_file = brain_dir / "claims" / "phase-18-claim.json"
+        claim_file = claimed_phase["file"]
         self.assert_file_exists(claim_file)
 
         events_before = count_events(brain_dir)
 
         # Release
-        result = run_brain_cmd(brain_cli_path, temp_repo, "phase", "release", "18")
+        result = run_brain_cmd(brain_cli_path, temp_repo, "phase", "release", claimed_phase["phase"])
         self.assert_command_success(result)
 
         # Claim removed, event logged
@@ -160,26 +258,20 @@ class TestPhaseACIDAtomicity(ACIDTestBase):
 class TestPhaseACIDConsistency(ACIDTestBase):
     """ACID Consistency: Phase state is always valid."""
 
-    def test_phase_claim_file_valid_json(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_phase_claim_file_valid_json(self, claimed_phase):
         """Phase claim file should be valid JSON with required fields."""
-        brain_dir = temp_repo / ".brain"
-
-        run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "19")
-
-        claim_file = brain_dir / "claims" / "phase-19-claim.json"
-        data = self.assert_valid_json(claim_file)
+        data = self.assert_valid_json(claimed_phase["file"])
 
         # Required fields
         assert "phase" in data or "by" in data or "ts" in data, "Claim should have metadata"
 
-    def test_phase_double_claim_prevented(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_phase_double_claim_prevented(self, temp_repo, brain_cli_path, claimed_phase):
         """Cannot claim same phase twice - consistency enforced."""
         # First claim succeeds
-        result1 = run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "20")
-        self.assert_command_success(result1)
+        self.assert_command_success(claimed_phase["result"])
 
         # Second claim should fail or warn
-        result2 = run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "20")
+        result2 = run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", claimed_phase["phase"])
         # Either fails or shows already claimed
         output = (result2.stdout + result2.stderr).lower()
         assert result2.returncode != 0 or "already" in output or "claimed" in output
@@ -209,18 +301,12 @@ class TestPhaseACIDIsolation(ACIDTestBase):
 class TestPhaseACIDDurability(ACIDTestBase):
     """ACID Durability: Phase changes persist."""
 
-    def test_phase_claim_persists(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_phase_claim_persists(self, claimed_phase):
         """Phase claim should persist after command completes."""
-        brain_dir = temp_repo / ".brain"
-
-        run_brain_cmd(brain_cli_path, temp_repo, "phase", "claim", "23")
-
-        claim_file = brain_dir / "claims" / "phase-23-claim.json"
-
-        # Multiple reads should return same result
-        content1 = claim_file.read_text()
-        content2 = Path(claim_file).read_text()  # Fresh Path object
-        assert content1 == content2, "Content should be durable"
+        claim = self.assert_valid_json(claimed_phase["file"])
+        assert claim["type"] == "claim"
+        assert claim["phase"] == 17, "Claim data should be durable"
+        assert claim["developer"] == "@testuser"
 
 
 # =============================================================================
@@ -235,12 +321,12 @@ class TestMissionACIDAtomicity(ACIDTestBase):
         brain_dir = temp_repo / ".brain"
         files_before = get_brain_files(brain_dir)
 
-        result = run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Test Mission")
+        # Through the real entry point, so brain_cli.py start-up stays covered
+        result = run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Test Mission", isolated=True)
         self.assert_command_success(result)
 
         # Mission file created atomically
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json")) if missions_dir.exists() else []
+        mission_files = list_mission_files(brain_dir)
         assert len(mission_files) >= 1, "Mission file should be created"
 
         # State changed (files added)
@@ -258,8 +344,7 @@ class TestMissionACIDConsistency(ACIDTestBase):
         result = run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Consistency Test")
         self.assert_command_success(result)
 
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
+        mission_files = list_mission_files(brain_dir)
         assert len(mission_files) >= 1
 
         data = self.assert_valid_json(mission_files[0])
@@ -283,8 +368,7 @@ class TestMissionACIDConsistency(ACIDTestBase):
             assert "timestamp" in data, "Event should have timestamp"
         else:
             # No events file - verify mission file is valid instead
-            missions_dir = brain_dir / "missions" / "active"
-            mission_files = list(missions_dir.glob("mission-*.json"))
+            mission_files = list_mission_files(brain_dir)
             assert len(mission_files) >= 1, "Mission file should exist"
             self.assert_valid_json(mission_files[0])
 
@@ -297,18 +381,13 @@ class TestMissionACIDIsolation(ACIDTestBase):
         brain_dir = temp_repo / ".brain"
 
         # Create two missions
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Mission A")
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Mission B")
+        seeded = seed_missions(brain_cli_path, temp_repo, "Mission A", "Mission B")
 
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
+        mission_files = list_mission_files(brain_dir)
         assert len(mission_files) >= 2, "Both missions should exist"
 
         # Each has unique ID
-        ids = set()
-        for f in mission_files:
-            data = json.loads(f.read_text())
-            ids.add(data["id"])
+        ids = {data["id"] for data in seeded}
         assert len(ids) >= 2, "Missions should have unique IDs"
 
 
@@ -321,14 +400,12 @@ class TestMissionACIDDurability(ACIDTestBase):
 
         run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Durable Mission")
 
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
+        mission_files = list_mission_files(brain_dir)
         assert len(mission_files) >= 1
 
         # Content is durable
-        original = mission_files[0].read_text()
-        reread = Path(mission_files[0]).read_text()
-        assert original == reread
+        mission = self.assert_valid_json(mission_files[0])
+        assert mission["title"] == "Durable Mission", "Mission data should be durable"
 
 
 # =============================================================================
@@ -338,27 +415,16 @@ class TestMissionACIDDurability(ACIDTestBase):
 class TestTaskACIDAtomicity(ACIDTestBase):
     """ACID Atomicity: Task operations complete entirely or not at all."""
 
-    def test_task_add_atomic(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_task_add_atomic(self, temp_repo, brain_cli_path, mission_with_id):
         """Task add should atomically update mission."""
-        brain_dir = temp_repo / ".brain"
-
-        # Create mission first
-        result = run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Task Test Mission")
-        self.assert_command_success(result)
-
-        # Get mission ID from output or file
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
-        mission_data = json.loads(mission_files[0].read_text())
-        mission_id = mission_data["id"]
-        tasks_before = len(mission_data.get("tasks", []))
+        tasks_before = len(mission_with_id["data"].get("tasks", []))
 
         # Add task
-        result = run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_id, "Test Task")
+        result = run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_with_id["id"], "Test Task")
         self.assert_command_success(result)
 
         # Task added to mission atomically
-        updated_mission = json.loads(mission_files[0].read_text())
+        updated_mission = read_json(mission_with_id["file"])
         tasks_after = len(updated_mission.get("tasks", []))
         assert tasks_after > tasks_before, "Task should be added to mission"
 
@@ -366,22 +432,12 @@ class TestTaskACIDAtomicity(ACIDTestBase):
 class TestTaskACIDConsistency(ACIDTestBase):
     """ACID Consistency: Task state is always valid."""
 
-    def test_task_has_valid_structure(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_task_has_valid_structure(self, temp_repo, brain_cli_path, mission_with_id):
         """Task should have valid structure with required fields."""
-        brain_dir = temp_repo / ".brain"
-
-        # Create mission and task
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Task Structure Test")
-
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
-        mission_data = json.loads(mission_files[0].read_text())
-        mission_id = mission_data["id"]
-
-        run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_id, "Structured Task")
+        run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_with_id["id"], "Structured Task")
 
         # Verify task structure
-        updated_mission = json.loads(mission_files[0].read_text())
+        updated_mission = read_json(mission_with_id["file"])
         tasks = updated_mission.get("tasks", [])
         assert len(tasks) >= 1
 
@@ -399,21 +455,15 @@ class TestTaskACIDIsolation(ACIDTestBase):
         brain_dir = temp_repo / ".brain"
 
         # Create two missions
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Mission X")
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Mission Y")
-
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = sorted(missions_dir.glob("mission-*.json"))
-
-        mission_x = json.loads(mission_files[0].read_text())
-        mission_y = json.loads(mission_files[1].read_text())
+        mission_x, mission_y = seed_missions(brain_cli_path, temp_repo, "Mission X", "Mission Y")
 
         # Add task to mission X only
         run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_x["id"], "Task for X")
 
         # Verify isolation
-        updated_x = json.loads(mission_files[0].read_text())
-        updated_y = json.loads(mission_files[1].read_text())
+        missions_dir = brain_dir / "missions" / "active"
+        updated_x = read_json(missions_dir / f"{mission_x['id']}.json")
+        updated_y = read_json(missions_dir / f"{mission_y['id']}.json")
 
         assert len(updated_x.get("tasks", [])) >= 1, "Mission X should have task"
         assert len(updated_y.get("tasks", [])) == 0, "Mission Y should have no tasks"
@@ -422,23 +472,13 @@ class TestTaskACIDIsolation(ACIDTestBase):
 class TestTaskACIDDurability(ACIDTestBase):
     """ACID Durability: Task changes persist."""
 
-    def test_task_persists(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_task_persists(self, temp_repo, brain_cli_path, mission_with_id):
         """Task should persist after creation."""
-        brain_dir = temp_repo / ".brain"
-
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Durable Task Mission")
-
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
-        mission_id = json.loads(mission_files[0].read_text())["id"]
-
-        run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_id, "Persistent Task")
+        run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_with_id["id"], "Persistent Task")
 
-        # Multiple reads return same result
-        read1 = json.loads(mission_files[0].read_text())
-        read2 = json.loads(Path(mission_files[0]).read_text())
-
-        assert read1["tasks"] == read2["tasks"], "Task data should be durable"
+        # Mission file holds the task
+        tasks = read_json(mission_with_id["file"])["tasks"]
+        assert [t["title"] for t in tasks] == ["Persistent Task"], "Task data should be durable"
 
 
 # =============================================================================
@@ -514,9 +554,9 @@ class TestMessageACIDDurability(ACIDTestBase):
         assert len(msg_files) >= 1
 
         # Content is durable
-        original = msg_files[0].read_text()
-        reread = Path(msg_files[0]).read_text()
-        assert original == reread
+        message = self.assert_valid_json(msg_files[0])
+        assert message["from"] == "testuser"
+        assert message["body"] == "Durable Message", "Message data should be durable"
 
 
 # =============================================================================
@@ -526,16 +566,9 @@ class TestMessageACIDDurability(ACIDTestBase):
 class TestCrossCommandACID(ACIDTestBase):
     """ACID tests for interactions between different command types."""
 
-    def test_mission_task_consistency(self, temp_repo, brain_cli_path, initialized_identity):
+    def test_mission_task_consistency(self, temp_repo, brain_cli_path, mission_with_id):
         """Mission and task operations maintain consistency."""
-        brain_dir = temp_repo / ".brain"
-
-        # Create mission
-        run_brain_cmd(brain_cli_path, temp_repo, "mission", "create", "Cross Command Test")
-
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
-        mission_id = json.loads(mission_files[0].read_text())["id"]
+        mission_id = mission_with_id["id"]
 
         # Add multiple tasks
         run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_id, "Task 1")
@@ -543,7 +576,7 @@ class TestCrossCommandACID(ACIDTestBase):
         run_brain_cmd(brain_cli_path, temp_repo, "task", "add", mission_id, "Task 3")
 
         # All tasks present and consistent
-        mission_data = json.loads(mission_files[0].read_text())
+        mission_data = read_json(mission_with_id["file"])
         assert len(mission_data.get("tasks", [])) >= 3
 
         # Each task has unique ID
@@ -564,8 +597,7 @@ class TestCrossCommandACID(ACIDTestBase):
         self.assert_file_exists(claim_file)
         self.assert_valid_json(claim_file)
 
-        missions_dir = brain_dir / "missions" / "active"
-        mission_files = list(missions_dir.glob("mission-*.json"))
+        mission_files = list_mission_files(brain_dir)
         for f in mission_files:
             self.assert_valid_json(f)
 
@@ -161,6 +161,66 @@ class TestAnnounceCommand:
         current_branch = brain.get_current_branch()
         assert current_branch == "feature/test"
 
+    def test_announce_with_events_branch_checked_out(self, brain, temp_git_repo_with_remote, create_identity):
+        """Announce should use the current tree when brain/events is already checked out."""
+        local_path, remote_path = temp_git_repo_with_remote
+        create_identity("claude")
+
+        args = MagicMock()
+        args.message = ["First"]
+        brain.cmd_announce(args)
+
+        subprocess.run(["git", "checkout", "brain/events"], check=True, capture_output=True)
+        args.message = ["Second"]
+        brain.cmd_announce(args)
+
+        assert brain.get_current_branch() == "brain/events"
+        result = subprocess.run(
+            ["git", "show", "origin/brain/events:.brain/shared-events.jsonl"],
+            capture_output=True, text=True
+        )
+        bodies = [json.loads(line)["body"] for line in result.stdout.strip().split("\n")]
+        assert bodies == ["First", "Second"]
+
+    def test_announce_fails_cleanly_on_merge_conflict(self, brain, temp_git_repo_with_remote, create_identity, tmp_path):
+        """A conflicting origin/brain/events should abort the merge and exit with an error."""
+        local_path, remote_path = temp_git_repo_with_remote
+        create_identity("claude")
+
+        args = MagicMock()
+        args.message = ["First"]
+        brain.cmd_announce(args)
+
+        # Another agent pushes a different event
+        other = tmp_path / "other"
+        subprocess.run(["git", "clone", "-q", "-b", "brain/events", str(remote_path), str(other)],
+                       check=True, capture_output=True)
+        with open(other / ".brain" / "shared-events.jsonl", "a") as f:
+            f.write('{"body": "remote"}\n')
+        subprocess.run(["git", "-C", str(other), "-c", "user.email=o@test.com", "-c", "user.name=O",
+                        "commit", "-qam", "remote event"], check=True, capture_output=True)
+        subprocess.run(["git", "-C", str(other), "push", "-q", "origin", "brain/events"],
+                       check=True, capture_output=True)
+
+        # Local unpushed event on the same line
+        subprocess.run(["git", "checkout", "-q", "brain/events"], check=True, capture_output=True)
+        with open(local_path / ".brain" / "shared-events.jsonl", "a") as f:
+            f.write('{"body": "local"}\n')
+        subprocess.run(["git", "commit", "-qam", "local event"], check=True, capture_output=True)
+        local_head = subprocess.run(["git", "rev-parse", "HEAD"],
+                                    capture_output=True, text=True).stdout.strip()
+        subprocess.run(["git", "checkout", "-q", "master"], check=True, capture_output=True)
+
+        args.message = ["Second"]
+        with pytest.raises(SystemExit):
+            brain.cmd_announce(args)
+
+        after = subprocess.run(["git", "rev-parse", "brain/events"],
+                               capture_output=True, text=True).stdout.strip()
+        assert after == local_head
+        worktrees = subprocess.run(["git", "worktree", "list"], capture_output=True, text=True).stdout
+        assert len(worktrees.strip().splitlines()) == 1
+
 
 class TestListenCommand:
     """Tests for the listen command."""
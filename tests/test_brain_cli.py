@@ -314,6 +314,27 @@ class TestLogCommand:
         
         assert result.returncode == 0
 
+    def test_log_fast_reads_git_log(self, temp_repo):
+        """log --fast should list brain commits without reading events.jsonl."""
+        brain_path = Path(__file__).parent.parent / "src" / "brain" / "brain_cli.py"
+
+        subprocess.run([sys.executable, str(brain_path), "init", "-n", "sender"],
+                       capture_output=True, text=True, cwd=temp_repo)
+        subprocess.run([sys.executable, str(brain_path), "msg", "send", "Hello", "fast"],
+                       capture_output=True, text=True, cwd=temp_repo)
+        (temp_repo / ".brain" / "events.jsonl").unlink()
+
+        result = subprocess.run(
+            [sys.executable, str(brain_path), "msg", "log", "--fast"],
+            capture_output=True,
+            text=True,
+            cwd=temp_repo
+        )
+
+        assert result.returncode == 0
+        assert "msg(sender): Hello fast" in result.stdout
+        assert "brain: add public key" not in result.stdout
+
 
 class TestPhasesCommand:
     """Test 'phases' command."""
@@ -366,3 +387,51 @@ class TestErrorHandling:
         # Should fail or show help
         assert result.returncode != 0 or "usage" in result.stdout.lower()
 
+
+
+class TestParserSpec:
+    """Test the declarative command spec table."""
+
+    def test_every_leaf_command_has_handler(self):
+        """Each leaf spec should resolve to an existing command function."""
+        import importlib
+        from brain.cli import COMMANDS
+
+        for name, spec in COMMANDS.items():
+            leaves = spec["commands"].values() if "commands" in spec else [spec]
+            for leaf in leaves:
+                module_name, func_name = leaf["handler"].split(".")
+                module = importlib.import_module(f"brain.{module_name}")
+                assert callable(getattr(module, func_name)), f"{name}: {leaf['handler']}"
+
+    def test_single_command_parser(self):
+        """build_parser(command) should parse that command's arguments."""
+        from brain.cli import build_parser, resolve_handler
+
+        args = build_parser("task").parse_args(["task", "claim", "mission-1", "task-1", "--force"])
+
+        assert args.mission_id == "mission-1"
+        assert args.task_id == "task-1"
+        assert args.force is True
+        assert resolve_handler(args) == "missions.cmd_task_claim"
+
+    def test_main_accepts_argv(self, temp_repo, capsys):
+        """main(argv) should dispatch the given arguments in-process."""
+        from brain.cli import main
+
+        main(["phase", "list"])
+
+        assert "PHASE" in capsys.readouterr().out.upper()
+
+    def test_cli_import_is_lazy(self):
+        """Importing brain.cli should not load the command modules; re-exports resolve on access."""
+        src_dir = Path(__file__).parent.parent / "src"
+        code = (
+            "import sys, brain.cli, brain; "
+            "print(sorted(m for m in sys.modules if m.startswith('brain.'))); "
+            "print(callable(brain.cmd_phases))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=src_dir, check=True)
+
+        assert result.stdout.splitlines() == ["['brain.cli', 'brain.core']", "True"]
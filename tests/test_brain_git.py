@@ -37,6 +37,24 @@ class TestGitUtilities:
         with pytest.raises(subprocess.CalledProcessError):
             brain_module.run_git("nonexistent-command")
     
+    def test_git_cat_file_reads_blobs(self, temp_repo, brain_core):
+        """GitCatFile should serve multiple reads and report missing objects."""
+        with brain_core.GitCatFile() as cat_file:
+            first = cat_file.read("HEAD:package.json")
+            missing = cat_file.read("HEAD:does-not-exist.json")
+            second = cat_file.read("HEAD:docs/PHASE-CLAIMS.md")
+
+        assert first == (temp_repo / "package.json").read_bytes()
+        assert missing is None
+        assert second == (temp_repo / "docs" / "PHASE-CLAIMS.md").read_bytes()
+
+    def test_iter_blob_lines(self, temp_repo, brain_core):
+        """iter_blob_lines should stream a blob's lines and yield nothing when missing."""
+        lines = list(brain_core.iter_blob_lines("HEAD:docs/PHASE-CLAIMS.md"))
+
+        assert b"".join(lines) == (temp_repo / "docs" / "PHASE-CLAIMS.md").read_bytes()
+        assert list(brain_core.iter_blob_lines("HEAD:does-not-exist.json")) == []
+
     def test_git_output(self, temp_repo, brain_module):
         """git_output should return stdout stripped."""
         output = brain_module.git_output("rev-parse", "--short", "HEAD")
@@ -124,7 +142,30 @@ class TestRemoteOperations:
         result = brain_module.get_remote_head("nonexistent/branch")
         
         assert result is None
-    
+
+    def test_core_get_remote_head_missing(self, temp_repo, brain_core):
+        """core.get_remote_head should return None without raising."""
+        assert brain_core.get_remote_head("nonexistent/branch") is None
+    
+    def test_deferred_push_coalesces(self, temp_repo, tmp_path, brain_core, monkeypatch):
+        """With BRAIN_DEFER_PUSH, repeated pushes of a branch should run once at flush."""
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], check=True, capture_output=True)
+        subprocess.run(["git", "remote", "add", "origin", str(remote)], check=True, capture_output=True)
+        branch = brain_core.get_current_branch()
+        monkeypatch.setenv("BRAIN_DEFER_PUSH", "1")
+        monkeypatch.setattr(brain_core, "_pending_pushes", {})
+
+        assert brain_core.safe_push(branch)
+        assert brain_core.safe_push(branch)
+        assert len(brain_core._pending_pushes) == 1
+        assert brain_core.get_remote_head(branch) is None
+
+        brain_core._flush_pending_pushes()
+
+        assert brain_core.get_remote_head(branch) == brain_core.get_head_commit()
+        assert brain_core._pending_pushes == {}
+
     def test_fetch_without_remote(self, temp_repo, brain_module):
         """Fetch should handle missing remote gracefully."""
         # This repo has no remote, fetch should not crash
@@ -72,6 +72,37 @@ class TestMessageCreation:
         assert filepath1.exists()
         assert filepath2.exists()
 
+    def test_save_messages_bulk(self, initialized_identity, brain_core, temp_repo):
+        """save_messages_bulk should write one file per message with a shared head commit."""
+        paths = brain_core.save_messages_bulk(
+            initialized_identity,
+            [("message", {"body": f"Message {i}"}) for i in range(5)]
+        )
+
+        assert len(set(paths)) == 5
+        messages = [json.loads(p.read_text()) for p in paths]
+        assert [m["body"] for m in messages] == [f"Message {i}" for i in range(5)]
+        assert len({m["head_commit"] for m in messages}) == 1
+
+    def test_save_messages_bulk_creates_directory_once(self, initialized_identity, brain_core,
+                                                       temp_repo, monkeypatch):
+        """save_messages_bulk should create the sender's directory once, not per message."""
+        calls = []
+        original_mkdir = Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return original_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        paths = brain_core.save_messages_bulk(
+            initialized_identity,
+            [("message", {"body": f"Message {i}"}) for i in range(5)]
+        )
+
+        assert all(p.exists() for p in paths)
+        assert calls.count(paths[0].parent) == 1
+
 
 class TestMessageTypes:
     """Test different message types."""
@@ -203,6 +234,25 @@ class TestEventAppending:
                 event = json.loads(line)
                 assert event["index"] == i
 
+    def test_read_events_returns_tail(self, brain_core, temp_repo):
+        """read_events should return only the last `limit` events, in order."""
+        for i in range(10):
+            brain_core.append_event({"type": "test", "index": i})
+
+        events = brain_core.read_events(3)
+
+        assert [e["index"] for e in events] == [7, 8, 9]
+
+    def test_read_events_tail_spans_blocks(self, brain_core, temp_repo, monkeypatch):
+        """Backward tail reads should stitch records split across block boundaries."""
+        monkeypatch.setattr(brain_core, "_TAIL_BLOCK", 7)
+        for i in range(20):
+            brain_core.append_event({"type": "test", "index": i})
+
+        assert [e["index"] for e in brain_core.read_events(5)] == [15, 16, 17, 18, 19]
+        assert len(brain_core.read_events(50)) == 20
+        assert len(brain_core.read_events(0)) == 20
+
 
 class TestEmptyAndEdgeCases:
     """Test edge cases for messages."""
@@ -495,6 +495,59 @@ class TestDoD:
         assert result.returncode == 0
         assert "Verified" in result.stdout
 
+    def test_run_check_capture_is_capped(self, temp_repo, mission_module, monkeypatch):
+        """run_check should cap the combined output it returns."""
+        monkeypatch.setattr(mission_module, "_CHECK_OUTPUT_CAP", 10)
+        check = mission_module.AutomatedCheck(
+            id="chk", description="chatty", command="echo out-0123456789; echo err >&2; exit 3",
+            expected_exit_code=3,
+        )
+
+        assert mission_module.run_check(check) == (True, "out-012345")
+
+    def test_gate_run_records_each_check_result(self, temp_repo, mission_module, capsys):
+        """Gate checks should each record their own result, reported in order."""
+        mission = mission_module.dict_to_mission({"id": "mission-abcd1234", "title": "Gates"})
+        mission.dod.automated = [
+            mission_module.AutomatedCheck(id="chk-pass", description="passes", command="exit 0"),
+            mission_module.AutomatedCheck(id="chk-fail", description="fails", command="exit 1"),
+        ]
+        mission_module.save_mission(mission)
+
+        class Args:
+            mission_id = "mission-abcd1234"
+
+        with pytest.raises(SystemExit):
+            mission_module.cmd_gate_run(Args())
+
+        out = capsys.readouterr().out
+        assert out.index("passes") < out.index("fails")
+        results = {c.id: c.last_result for c in mission_module.load_mission(mission.id).dod.automated}
+        assert results == {"chk-pass": "pass", "chk-fail": "fail"}
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_gate_run_jobs(self, temp_repo, mission_module, capsys, jobs):
+        """Checks run one at a time by default; --jobs runs them concurrently."""
+        mission = mission_module.dict_to_mission({"id": "mission-abcd1234", "title": "Gates"})
+        mission.dod.automated = [
+            mission_module.AutomatedCheck(id="chk-slow", description="slow",
+                                          command="sleep 0.3; echo slow >> order.txt"),
+            mission_module.AutomatedCheck(id="chk-fast", description="fast",
+                                          command="echo fast >> order.txt"),
+        ]
+        mission_module.save_mission(mission)
+
+        class Args:
+            mission_id = "mission-abcd1234"
+
+        Args.jobs = jobs
+        mission_module.cmd_gate_run(Args())
+
+        order = (temp_repo / "order.txt").read_text().split()
+        assert order == (["slow", "fast"] if jobs == 1 else ["fast", "slow"])
+        out = capsys.readouterr().out
+        assert out.index("slow") < out.index("fast")
+
 
 class TestMissionStart:
     """Test mission start."""
@@ -711,6 +764,38 @@ class TestMissionStorage:
         active_dir = temp_repo / ".brain" / "missions" / "active"
         assert not (active_dir / f"{mission_id}.json").exists()
 
+    def test_dict_to_mission_round_trip(self, mission_module):
+        """Mission dicts should hydrate back losslessly and ignore unknown keys."""
+        data = {
+            "id": "mission-abcd1234",
+            "title": "Round Trip",
+            "tasks": [
+                {"id": "task-1", "title": "First", "status": "complete", "legacy_field": 1},
+                {"id": "task-2", "title": "Second"},
+            ],
+        }
+
+        mission = mission_module.dict_to_mission(data)
+        assert [t.title for t in mission.tasks] == ["First", "Second"]
+        assert mission.tasks[0].status == "complete"
+
+        saved = mission_module.dataclass_to_dict(mission)
+        assert mission_module.dataclass_to_dict(mission_module.dict_to_mission(saved)) == saved
+
+    def test_save_and_commit_skips_unchanged_mission(self, temp_repo, mission_module):
+        """Re-saving an unchanged mission should neither rewrite nor commit it."""
+        mission = mission_module.dict_to_mission({"id": "mission-abcd1234", "title": "No-op"})
+        filepath, success, _ = mission_module.save_and_commit(mission, "mission(test): first save")
+        assert success
+        content = filepath.read_bytes()
+
+        reloaded = mission_module.load_mission(mission.id)
+        assert mission_module.save_and_commit(reloaded, "mission(test): no-op") == (filepath, False, "")
+        assert filepath.read_bytes() == content
+
+        reloaded.title = "Changed"
+        assert mission_module.save_and_commit(reloaded, "mission(test): rename")[1]
+
 
 class TestDefaultChecklists:
     """Test default checklist content."""
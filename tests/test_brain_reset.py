@@ -265,6 +265,26 @@ class TestResetMessages:
         # Identity should still exist
         assert self_file.exists()
 
+    def test_reset_many_message_entries(self, temp_repo, brain_cli_path, initialized_identity):
+        """reset should clear directories large enough to use parallel deletion."""
+        messages_dir = temp_repo / ".brain" / "messages"
+        for i in range(40):
+            agent_dir = messages_dir / f"agent{i}"
+            agent_dir.mkdir(parents=True, exist_ok=True)
+            (agent_dir / "20251203-120000-msg.json").write_text('{"type": "msg"}')
+            (messages_dir / f"loose-{i}.json").write_text('{"type": "msg"}')
+
+        result = subprocess.run(
+            [sys.executable, str(brain_cli_path), "reset", "--messages", "--force"],
+            capture_output=True,
+            text=True,
+            cwd=temp_repo
+        )
+
+        assert result.returncode == 0
+        assert messages_dir.exists()
+        assert list(messages_dir.iterdir()) == []
+
 
 class TestResetReceipts:
     """Test reset clears receipts."""
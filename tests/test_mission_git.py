@@ -102,6 +102,45 @@ class TestMissionGitIntegration:
         
         assert new_commits == initial_commits + 1, "Task add should commit to Git"
     
+    def test_reclaim_own_task_is_noop(self, temp_repo, mission_module, initialized_identity, capsys):
+        """Claiming a task we already hold should not emit another event."""
+        class CreateArgs:
+            title = ["Test Mission"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(CreateArgs())
+        mid = mission_module.list_missions()[0]['id']
+
+        class TaskArgs:
+            mission_id = mid
+            title = ["Claimable Task"]
+            type = None
+            description = None
+
+        mission_module.cmd_task_add(TaskArgs())
+        task_id = mission_module.load_mission(mid).tasks[0].id
+
+        class ClaimArgs:
+            mission_id = mid
+            task_id = None
+            force = False
+            push = False
+        ClaimArgs.task_id = task_id
+
+        mission_module.cmd_task_claim(ClaimArgs())
+        head = subprocess.run(["git", "rev-parse", "HEAD"],
+                              capture_output=True, text=True, cwd=temp_repo).stdout
+        capsys.readouterr()
+
+        mission_module.cmd_task_claim(ClaimArgs())
+
+        assert subprocess.run(["git", "rev-parse", "HEAD"],
+                              capture_output=True, text=True, cwd=temp_repo).stdout == head
+        assert len(mission_module.read_mission_events(mid)) == 1
+        assert "no-op" in capsys.readouterr().out
+
     def test_beforecode_check_commits_to_git(self, temp_repo, mission_module, initialized_identity):
         """Checking a beforeCode item should create a Git commit."""
         # Create mission
@@ -310,3 +349,326 @@ class TestMissionFilesTracked:
         assert ".brain/missions/" in result.stdout or "mission-" in result.stdout, \
             "Mission files should be tracked in Git"
 
+
+
+class TestMissionBranchAggregation:
+    """Test that missions and events are read from remote branches."""
+
+    def test_remote_missions_and_events_are_aggregated(self, temp_repo, tmp_path, mission_module):
+        """Missions and events pushed to another branch should be visible without checkout."""
+        class Args:
+            title = ["Remote Mission"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+        mid = mission_module.list_missions()[0]['id']
+        mission_module.emit_mission_event(
+            mission_module.MissionEventType.MISSION_STARTED, mid, "agent-x"
+        )
+
+        # Publish this history as another agent's branch, then drop local copies
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], check=True, capture_output=True)
+        subprocess.run(["git", "remote", "add", "origin", str(remote)], check=True, capture_output=True)
+        subprocess.run(["git", "push", "origin", "HEAD:refs/heads/agent-x"], check=True, capture_output=True)
+        import shutil
+        shutil.rmtree(temp_repo / ".brain" / "missions")
+
+        missions = mission_module.list_missions()
+        assert [(m['id'], m['_source']) for m in missions] == [(mid, "origin/agent-x")]
+
+        events = mission_module.read_mission_events(mid)
+        assert [e['_source_branch'] for e in events] == ["origin/agent-x"]
+
+        mission = mission_module.load_mission(mid)
+        assert mission.title == "Remote Mission"
+        assert mission.status == mission_module.MissionStatus.ACTIVE.value
+
+    def test_parallel_branch_reads_deduplicate(self, temp_repo, tmp_path, mission_module):
+        """Reading several branches concurrently should keep branch order for dedup."""
+        class Args:
+            title = ["Shared Mission"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+        mid = mission_module.list_missions()[0]['id']
+        mission_module.emit_mission_event(
+            mission_module.MissionEventType.MISSION_STARTED, mid, "agent-a"
+        )
+
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], check=True, capture_output=True)
+        subprocess.run(["git", "remote", "add", "origin", str(remote)], check=True, capture_output=True)
+        for name in ["agent-a", "agent-b", "agent-c"]:
+            subprocess.run(["git", "push", "origin", f"HEAD:refs/heads/{name}"],
+                           check=True, capture_output=True)
+        import shutil
+        shutil.rmtree(temp_repo / ".brain" / "missions")
+
+        assert [m['id'] for m in mission_module.list_missions()] == [mid]
+        events = mission_module.read_mission_events(mid)
+        assert [e['_source_branch'] for e in events] == ["origin/agent-a"]
+
+    def test_fetch_all_reused_within_ttl(self, temp_repo, tmp_path, mission_module, monkeypatch):
+        """Back-to-back reads in one process should share one git fetch --all."""
+        remote = tmp_path / "remote.git"
+        subprocess.run(["git", "init", "--bare", str(remote)], check=True, capture_output=True)
+        subprocess.run(["git", "remote", "add", "origin", str(remote)], check=True, capture_output=True)
+
+        calls = []
+        real_run_git = mission_module.run_git
+
+        def counting_run_git(*args, **kwargs):
+            calls.append(args)
+            return real_run_git(*args, **kwargs)
+
+        monkeypatch.setattr(mission_module, "run_git", counting_run_git)
+        monkeypatch.setattr(mission_module, "_last_fetch", {})
+        mission_module.list_missions()
+        mission_module.read_mission_events()
+
+        assert calls.count(("fetch", "--all")) == 1
+
+        # A new process starts without a fetch record and fetches again
+        monkeypatch.setattr(mission_module, "_last_fetch", {})
+        mission_module.list_missions()
+
+        assert calls.count(("fetch", "--all")) == 2
+        assert not list((temp_repo / ".git").glob("brain-last-fetch"))
+
+    def test_load_mission_lists_remote_branches_once(self, temp_repo, mission_module, monkeypatch):
+        """load_mission should reuse one remote branch listing for snapshot and replay reads."""
+        class Args:
+            title = ["Branch Listing"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+        mid = mission_module.list_missions()[0]['id']
+        mission_module.emit_mission_event(mission_module.MissionEventType.MISSION_STARTED, mid, "agent-x")
+        mission_module.load_mission(mid)
+        # Invalidate the snapshot cursor so the load falls back to a full replay
+        mission_module.emit_mission_event(mission_module.MissionEventType.MISSION_COMPLETED, mid, "agent-x")
+        snapshot_file = mission_module.MISSION_SNAPSHOTS_DIR / f"{mid}.json"
+        snapshot = json.loads(snapshot_file.read_text())
+        snapshot["cursor"] = "9999"
+        snapshot_file.write_text(json.dumps(snapshot))
+
+        calls = []
+        real_get_remote_branches = mission_module._get_remote_branches
+        monkeypatch.setattr(mission_module, "_get_remote_branches",
+                            lambda: calls.append(1) or real_get_remote_branches())
+
+        assert mission_module.load_mission(mid).status == "complete"
+        assert len(calls) == 1
+
+    def test_list_missions_never_reads_events(self, temp_repo, mission_module, monkeypatch):
+        """list_missions should stay independent of event volume."""
+        class Args:
+            title = ["Header Only"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("list_missions must not read events")
+
+        monkeypatch.setattr(mission_module, "read_mission_events", fail)
+        monkeypatch.setattr(mission_module, "_read_events_from_branch", fail)
+
+        assert [m['title'] for m in mission_module.list_missions()] == ["Header Only"]
+
+
+class TestMissionSnapshots:
+    """Test incremental event replay via local mission snapshots."""
+
+    def test_snapshot_applies_only_new_events(self, temp_repo, mission_module):
+        """A reload after a new event should match a full replay and stay out of git."""
+        class Args:
+            title = ["Snapshot Mission"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+        mid = mission_module.list_missions()[0]['id']
+        events = mission_module.MissionEventType
+
+        mission_module.emit_mission_event(events.MISSION_STARTED, mid, "agent-x")
+        assert mission_module.load_mission(mid).status == "active"
+        snapshot_file = mission_module.MISSION_SNAPSHOTS_DIR / f"{mid}.json"
+        assert snapshot_file.exists()
+
+        mission_module.emit_mission_event(events.MISSION_COMPLETED, mid, "agent-x")
+        incremental = mission_module.load_mission(mid)
+        snapshot_file.unlink()
+        full = mission_module.load_mission(mid)
+
+        assert incremental.status == "complete"
+        assert mission_module.dataclass_to_dict(incremental) == mission_module.dataclass_to_dict(full)
+        assert len(json.loads(snapshot_file.read_text())["event_ids"]) == 2
+
+        status = subprocess.run(["git", "status", "--porcelain", "--ignored=no"],
+                                capture_output=True, text=True, cwd=temp_repo)
+        assert ".brain/cache" not in status.stdout
+
+
+    def test_snapshot_replays_when_event_retracted(self, temp_repo, mission_module):
+        """An applied event that disappears should be dropped from the reloaded mission."""
+        class Args:
+            title = ["Retracted Mission"]
+            description = None
+            approach = None
+            priority = None
+
+        mission_module.cmd_mission_create(Args())
+        mid = mission_module.list_missions()[0]['id']
+
+        event_file = mission_module.emit_mission_event(mission_module.MissionEventType.MISSION_STARTED,
+                                                       mid, "agent-x")
+        assert mission_module.load_mission(mid).status == "active"
+
+        Path(event_file).unlink()
+
+        assert mission_module.load_mission(mid).status == "planning"
+        snapshot = json.loads((mission_module.MISSION_SNAPSHOTS_DIR / f"{mid}.json").read_text())
+        assert snapshot["event_ids"] == []
+
+class TestMissionEventFiles:
+    """Test mission-scoped event file naming."""
+
+    def test_event_filename_scopes_reads_to_mission(self, temp_repo, mission_module, monkeypatch):
+        """Events of other missions should be skipped by filename; legacy names still load."""
+        events = mission_module.MissionEventType
+        path_a = mission_module.emit_mission_event(events.MISSION_STARTED, "mission-aaaa", "agent-x")
+        mission_module.emit_mission_event(events.MISSION_STARTED, "mission-bbbb", "agent-x")
+        assert path_a.name.endswith("__mission-aaaa.json")
+
+        legacy = mission_module.MISSION_EVENTS_DIR / "evt-legacy01.json"
+        legacy.write_text(json.dumps({
+            "id": "evt-legacy01", "event_type": "mission_completed", "mission_id": "mission-aaaa",
+            "timestamp": "2999-01-01T00:00:00+00:00", "actor": "agent-y", "data": {},
+        }))
+
+        read = []
+        real_load_json = mission_module.load_json
+        monkeypatch.setattr(mission_module, "load_json", lambda p: read.append(p.name) or real_load_json(p))
+
+        result = mission_module.read_mission_events("mission-aaaa")
+
+        assert [e['event_type'] for e in result] == ["mission_started", "mission_completed"]
+        assert not any("mission-bbbb" in name for name in read)
+
+    def test_event_without_timestamp_sorts_first(self, temp_repo, mission_module):
+        """An event file missing its timestamp should still be read and replayed first."""
+        mission_module.emit_mission_event(mission_module.MissionEventType.MISSION_STARTED,
+                                          "mission-aaaa", "agent-x")
+        (mission_module.MISSION_EVENTS_DIR / "evt-nots.json").write_text(json.dumps({
+            "id": "evt-nots", "event_type": "mission_completed", "mission_id": "mission-aaaa",
+            "actor": "agent-y", "data": {},
+        }))
+
+        result = mission_module.read_mission_events("mission-aaaa")
+
+        assert [e['id'] for e in result][0] == "evt-nots"
+        assert len(result) == 2
+
+    def test_apply_events_bulk_buckets_by_mission(self, temp_repo, mission_module):
+        """Bulk replay should route each event only to its own mission."""
+        events = mission_module.MissionEventType
+        mission_module.emit_mission_event(events.MISSION_STARTED, "mission-aaaa", "agent-x")
+        mission_module.emit_mission_event(events.MISSION_ABANDONED, "mission-bbbb", "agent-x")
+        missions = [mission_module.dict_to_mission({"id": mid, "title": mid})
+                    for mid in ("mission-aaaa", "mission-bbbb", "mission-cccc")]
+
+        result = mission_module.apply_events_to_missions_bulk(missions, mission_module.read_mission_events())
+
+        assert {mid: m.status for mid, m in result.items()} == {
+            "mission-aaaa": "active", "mission-bbbb": "abandoned", "mission-cccc": "planning",
+        }
+
+    def test_emit_events_batch_commits_once(self, temp_repo, mission_module):
+        """Events emitted inside emit_events_batch should share a single commit."""
+        def commit_count():
+            result = subprocess.run(["git", "rev-list", "--count", "HEAD"],
+                                    capture_output=True, text=True, cwd=temp_repo)
+            return int(result.stdout.strip())
+
+        events = mission_module.MissionEventType
+        before = commit_count()
+        with mission_module.emit_events_batch():
+            mission_module.emit_mission_event(events.TASK_CLAIMED, "mission-aaaa", "agent-x", {"task_id": "t1"})
+            mission_module.emit_mission_event(events.TASK_STARTED, "mission-aaaa", "agent-x", {"task_id": "t1"})
+
+        assert commit_count() == before + 1
+        assert len(mission_module.read_mission_events("mission-aaaa")) == 2
+        status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True, cwd=temp_repo)
+        assert "events/" not in status.stdout
+
+    def test_emit_mission_events_combines_commit_message(self, temp_repo, mission_module):
+        """emit_mission_events should commit one mission's events under a joined subject."""
+        events = mission_module.MissionEventType
+        paths = mission_module.emit_mission_events("mission-aaaa", "agent-x", [
+            (events.TASK_CLAIMED, {"task_id": "t1"}),
+            (events.TASK_STARTED, {"task_id": "t1"}),
+        ])
+
+        subject = subprocess.run(["git", "log", "-1", "--format=%s"],
+                                 capture_output=True, text=True, cwd=temp_repo).stdout.strip()
+        assert len(paths) == 2
+        assert subject == "event(task_claimed+task_started): mission-aaaa by agent-x"
+
+    def test_buffered_events_commit_on_flush(self, temp_repo, mission_module, monkeypatch):
+        """Under BRAIN_BATCH_EVENTS, events should stay uncommitted until flush_events."""
+        def commit_count():
+            result = subprocess.run(["git", "rev-list", "--count", "HEAD"],
+                                    capture_output=True, text=True, cwd=temp_repo)
+            return int(result.stdout.strip())
+
+        monkeypatch.setenv("BRAIN_BATCH_EVENTS", "1")
+        before = commit_count()
+        for item in ("bc-1", "bc-2", "bc-3"):
+            mission_module.emit_mission_event(mission_module.MissionEventType.CHECKLIST_CHECKED,
+                                              "mission-aaaa", "agent-x", {"item_id": item})
+        assert commit_count() == before
+
+        assert mission_module.flush_events() == 3
+        assert commit_count() == before + 1
+        assert mission_module.flush_events() == 0
+
+    def test_buffered_task_start_waits_for_flush(self, temp_repo, mission_module,
+                                                 initialized_identity, monkeypatch):
+        """Under BRAIN_BATCH_EVENTS, task start should leave its events for mission flush."""
+        def git(*args):
+            return subprocess.run(["git", *args], capture_output=True, text=True, cwd=temp_repo).stdout
+
+        mission = mission_module.dict_to_mission({
+            "id": "mission-abcd1234", "title": "Buffered",
+            "tasks": [{"id": "task-1", "title": "Buffered task"}],
+        })
+        mission_module.save_mission(mission)
+        monkeypatch.setenv("BRAIN_BATCH_EVENTS", "1")
+        head = git("rev-parse", "HEAD")
+
+        class Args:
+            mission_id = "mission-abcd1234"
+            task_id = "task-1"
+            push = False
+
+        mission_module.cmd_task_start(Args())
+
+        untracked = git("ls-files", "--others", "--", str(mission_module.MISSION_EVENTS_DIR)).split()
+        assert len(untracked) == 2
+        assert git("rev-parse", "HEAD") == head
+
+        mission_module.cmd_mission_flush(Args())
+        assert git("rev-parse", "HEAD") != head
+        assert git("ls-files", "--others", "--", str(mission_module.MISSION_EVENTS_DIR)) == ""
+        assert sorted(git("show", "--name-only", "--format=", "HEAD").split()) == sorted(untracked)